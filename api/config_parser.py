@@ -2,6 +2,7 @@
 
 import yaml
 from typing import Dict, Optional
+from device_layer.device_config import DeviceFactory
 
 
 class ConfigParser:
@@ -50,7 +51,9 @@ class ConfigParser:
             True if valid
         """
         required_keys = ["num_tiles", "tile_size", "device_type"]
-        return all(key in config for key in required_keys)
+        if not all(key in config for key in required_keys):
+            return False
+        return config["device_type"] in DeviceFactory.available()
 
     @staticmethod
     def get_defaults() -> Dict:
@@ -62,4 +65,5 @@ class ConfigParser:
             "mode": "snn",
             "timesteps": 100,
             "quantization_bits": 8,
+            "seed": None,
         }
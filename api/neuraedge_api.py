@@ -4,6 +4,8 @@ from typing import Dict
 import numpy as np
 from architecture.tile_manager import TileManager
 from architecture.execution_engine import ExecutionEngine
+from architecture.precision import PrecisionPolicy
+from architecture.weight_slicing import WeightSlicer
 from device_layer.device_config import DeviceConfig, DeviceFactory
 
 
@@ -25,17 +27,80 @@ class NeuraEdge:
             "tile_size": config.get("tile_size", 64),
             "device_type": config.get("device_type", "reram"),
             "mode": config.get("mode", "snn"),
+            "seed": config.get("seed"),
+            "drift_enabled": config.get("drift_enabled", True),
+            "quantization_bits": config.get("quantization_bits"),
+            "bits_per_cell": config.get("bits_per_cell", 8),
+            "differential_weights": config.get("differential_weights", False),
+            "enable_stuck_at_faults": config.get("enable_stuck_at_faults", False),
+            "fault_rate": config.get("fault_rate", 0.001),
+            "fault_pattern": config.get("fault_pattern", "random"),
+            "read_noise": config.get("read_noise", "device"),
+            "noise_level": config.get("noise_level", 0.02),
+            "lognormal_sigma": config.get("lognormal_sigma", 0.0),
+            "rtn_amplitude": config.get("rtn_amplitude", 0.0),
+            "rtn_flip_probability": config.get("rtn_flip_probability", 0.0),
+            "endurance_cycles": config.get("endurance_cycles"),
+            "write_verify": config.get("write_verify", False),
+            "verify_tolerance": config.get("verify_tolerance", 0.01),
+            "iv_table": config.get("iv_table", False),
+            "iv_table_cache_dir": config.get("iv_table_cache_dir"),
+            "mlc_levels": config.get("mlc_levels"),
+            "mlc_spacing": config.get("mlc_spacing", "linear"),
+            "mlc_level_sigma": config.get("mlc_level_sigma", 0.0),
+            "d2d_gain_sigma": config.get("d2d_gain_sigma", 0.0),
+            "d2d_offset_sigma": config.get("d2d_offset_sigma", 0.0),
+            "variation_cache_dir": config.get("variation_cache_dir"),
+            "device_params": config.get("device_params", {}),
+            # "float32", or {"storage": "float16", "compute": "float32"}
+            "precision": config.get("precision"),
         }
 
         # Initialize device
-        device_config = DeviceConfig(device_type=self.config["device_type"])
+        device_config = DeviceConfig(
+            device_type=self.config["device_type"],
+            drift_enabled=self.config["drift_enabled"],
+            bits_per_cell=self.config["bits_per_cell"],
+            enable_stuck_at_faults=self.config["enable_stuck_at_faults"],
+            fault_rate=self.config["fault_rate"],
+            fault_pattern=self.config["fault_pattern"],
+            read_noise=self.config["read_noise"],
+            noise_level=self.config["noise_level"],
+            lognormal_sigma=self.config["lognormal_sigma"],
+            rtn_amplitude=self.config["rtn_amplitude"],
+            rtn_flip_probability=self.config["rtn_flip_probability"],
+            endurance_cycles=self.config["endurance_cycles"],
+            write_verify=self.config["write_verify"],
+            verify_tolerance=self.config["verify_tolerance"],
+            iv_table=self.config["iv_table"],
+            iv_table_cache_dir=self.config["iv_table_cache_dir"],
+            mlc_levels=self.config["mlc_levels"],
+            mlc_spacing=self.config["mlc_spacing"],
+            mlc_level_sigma=self.config["mlc_level_sigma"],
+            d2d_gain_sigma=self.config["d2d_gain_sigma"],
+            d2d_offset_sigma=self.config["d2d_offset_sigma"],
+            variation_cache_dir=self.config["variation_cache_dir"],
+            device_params=self.config["device_params"],
+        )
         device = DeviceFactory.create(device_config)
 
+        # Weights more precise than one cell are bit-sliced across columns
+        weight_slicer = None
+        weight_bits = self.config["quantization_bits"]
+        if weight_bits is not None and weight_bits > device_config.bits_per_cell:
+            weight_slicer = WeightSlicer(weight_bits, device_config.bits_per_cell)
+
         # Initialize hardware
         self.tile_manager = TileManager(
             num_tiles=self.config["num_tiles"],
             tile_size=self.config["tile_size"],
-            device_model=device
+            device_model=device,
+            seed=self.config["seed"],
+            drift_enabled=device_config.drift_enabled,
+            weight_slicer=weight_slicer,
+            differential=self.config["differential_weights"],
+            device_config=device_config,
+            precision=PrecisionPolicy.from_config(self.config["precision"]),
         )
 
         self.execution_engine = ExecutionEngine(
@@ -80,6 +145,16 @@ class NeuraEdge:
         )
         return np.array(result["outputs"])
 
+    def advance_time(self, time_ms: float):
+        """
+        Let simulated time pass (e.g. idle retention). Drift is applied
+        lazily to each tile when it is next used.
+
+        Args:
+            time_ms: Simulated time in milliseconds
+        """
+        self.tile_manager.advance_time(time_ms)
+
     def get_power_report(self) -> dict:
         """Get power report."""
         return self.execution_engine.get_power_report()
@@ -0,0 +1,61 @@
+"""
+Column ADC model for NeuraEdge crossbars.
+Fixed full-scale range with per-column gain/offset calibration and
+saturation, vectorized over (batch, columns) reads.
+"""
+
+import numpy as np
+
+
+class ADCModel:
+    """Bank of per-column ADCs with fixed, calibrated input ranges."""
+
+    def __init__(self, bits: int = 8):
+        """
+        Args:
+            bits: ADC resolution
+        """
+        self.bits = bits
+        self.offset = None
+        self.gain = None
+        self.saturation_count = 0
+
+    @property
+    def levels(self) -> int:
+        """Highest output code."""
+        return (1 << self.bits) - 1
+
+    @property
+    def is_calibrated(self) -> bool:
+        return self.gain is not None
+
+    def calibrate(self, column_full_scale: np.ndarray, column_offset: np.ndarray = None):
+        """
+        Trim each column's gain and offset so [offset, full_scale] spans the code range.
+        Computed once (after programming) and reused for every conversion.
+
+        Args:
+            column_full_scale: Column current mapped to the top code (cols,)
+            column_offset: Column current mapped to code 0 (cols,)
+        """
+        if column_offset is None:
+            column_offset = np.zeros_like(column_full_scale)
+        span = column_full_scale - column_offset
+        self.offset = column_offset
+        self.gain = 1.0 / np.where(span > 0, span, 1.0)
+
+    def convert(self, currents: np.ndarray) -> np.ndarray:
+        """
+        Quantize column currents; values outside the calibrated range saturate.
+
+        Args:
+            currents: Column currents (cols,) or (batch, cols)
+
+        Returns:
+            Reconstructed currents at ADC resolution (same shape)
+        """
+        codes = np.round((currents - self.offset) * self.gain * self.levels)
+        saturated = (codes < 0) | (codes > self.levels)
+        self.saturation_count += int(np.count_nonzero(saturated))
+        codes = np.clip(codes, 0, self.levels)
+        return codes / (self.levels * self.gain) + self.offset
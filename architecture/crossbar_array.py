@@ -1,52 +1,528 @@
 """
 Memristive crossbar array for NeuraEdge.
 Implements weight programming, ADC/DAC conversion, and read current integration.
+
+Conductances are held in a single (rows x cols) array so that programming,
+reads, noise, IR drop and ADC quantization run as whole-array operations
+instead of one Python call per cell.
 """
 
+import hashlib
+from collections import OrderedDict
 import numpy as np
+from typing import Union
 from device_layer.base_device import DeviceModel
-from typing import List
+from device_layer.device_config import DeviceFactory
+from device_layer.drift_models import EnduranceDegradation
+from device_layer.random_streams import resolve_rng
+from device_layer.noise_models import NoisePipeline, StuckAtFaultMap
+from device_layer.mlc_levels import MLCLevels
+from device_layer.variation_maps import DeviceVariationMap
+from architecture.ir_drop import IRDropSolver
+from architecture.adc import ADCModel
+from architecture.precision import PrecisionPolicy, resolve_precision
+from architecture.weight_slicing import WeightSlicer
 
 
 class CrossbarArray:
-    """Memristive crossbar array (e.g., 64x64)."""
+    """Memristive crossbar array (e.g., 64x64 or 784x128)."""
 
-    def __init__(self, size: int, device_model: DeviceModel):
+    def __init__(self, size: int, device_model: Union[DeviceModel, str], rng: np.random.Generator = None,
+                 weight_slicer: WeightSlicer = None, differential: bool = False, cols: int = None,
+                 precision: PrecisionPolicy = None):
         """
         Args:
-            size: Crossbar dimensions (size x size)
-            device_model: Device model instance (ReRAM/PCM/SRAM)
+            size: Crossbar rows (inputs); also the column count unless cols is given
+            device_model: Device model instance, or a registered device name
+            rng: Generator for programming variation and read noise
+                 (None uses the global np.random state)
+            weight_slicer: Optional bit-slicing of weights over adjacent columns
+            differential: Store signed weights on a G+/G- pair of conductance planes
+            cols: Logical weight columns (outputs); defaults to size
+            precision: Storage/compute dtypes (None keeps float64 throughout)
         """
         self.size = size
-        self.device_model = device_model
-        self.weights = np.zeros((size, size))
-        self.devices = [[device_model.__class__() for _ in range(size)] for _ in range(size)]
+        self.cols = size if cols is None else cols
+        self.device_model = DeviceFactory.resolve(device_model)
+        self.rng = resolve_rng(rng)
+        self.weight_slicer = weight_slicer
+        self.differential = differential
+        self.precision = resolve_precision(precision)
+        # Narrow storage holds conductances in units of Gmax: siemens-scale
+        # values would fall into float16's subnormal range
+        self._conductance_unit = (
+            1.0 if self.precision.full_width_storage else self.device_model.max_conductance
+        )
+        # Each logical column takes one physical column per weight slice, and
+        # differential mode puts G+ and G- planes side by side on shared rows
+        self.num_slices = 1 if weight_slicer is None else weight_slicer.num_slices
+        self.plane_columns = self.cols * self.num_slices
+        self.num_planes = 2 if differential else 1
+        self.physical_columns = self.plane_columns * self.num_planes
+        self.output_size = self.cols
+        # Weight value mapped to full conductance by the last program_weights
+        self.weight_scale = 1.0
+        # Logical weights in a compact form that programming targets are
+        # derived from exactly: integer weight codes with a weight slicer,
+        # else weights / weight_scale (clipped to [-1, 1]) in the storage dtype
+        self._weight_store = np.zeros((size, self.output_size), dtype=self._weight_dtype)
+        # Bumped on every conductance change; keys cached derived state
+        self.conductance_version = 0
+        self._column_noise_moments = None
+        # Optional MLC mode: cells hold uint8 codes into a small level table
+        self.mlc: MLCLevels = None
+        self.level_codes = None
+        self.level_table = None
+        # Cells written at different times drift by different amounts: each
+        # cell's uint8 drift epoch indexes epoch_ages, the time since that
+        # epoch was programmed (drift_epochs None: every cell in epoch 0)
+        self.drift_epochs = None
+        self.epoch_ages = np.zeros(1)
+        # Unprogrammed cells sit at the device's initial (mid-range) conductance
+        self._set_programmed(
+            np.full((size, self.physical_columns), self.device_model.current_conductance)
+        )
+        # Time since the last write (ms); drift itself is evaluated in closed
+        # form from each cell's epoch age
+        self.drift_age = 0.0
+        # Optional stuck-at fault masks (see set_fault_map)
+        self.fault_map = None
+        # Optional fixed per-cell programming gain/offset (device-to-device
+        # variation); cycle-to-cycle variation comes from the device model
+        self.variation_map: DeviceVariationMap = None
+        # Writes per physical cell, and optional wear model fed by them
+        self.write_counts = np.zeros((size, self.physical_columns), dtype=np.uint32)
+        self.endurance_model: EnduranceDegradation = None
+        # "single" writes each cell once; "write_verify" repeats pulse + verify
+        # read until every cell is within verify_tolerance * max_conductance
+        self.program_mode = "single"
+        self.verify_tolerance = 0.01
+        self.max_pulses = 20
+        # Pulse/verify counts of the last programming operation
+        self.program_stats = {}
         self.ir_drop_enabled = True
-        self.adc_bits = 8
+        # "simple" applies a fixed 5% loss; "nodal" solves the resistive wire network
+        self.ir_drop_model = "simple"
+        self.ir_solver = IRDropSolver()
+        self.adc = ADCModel(bits=8)
+        # "calibrated" uses fixed per-column ranges; "dynamic" rescales each read by its max
+        self.adc_mode = "calibrated"
+        # Input voltage that maps to ADC full scale
+        self.read_voltage = 1.0
         self.dac_bits = 8
+        # "analog" applies inputs as voltages; "bit_serial" streams dac_bits binary planes
+        self.input_mode = "analog"
+        # Density of driven rows (over a whole batch) below which reads gather only those rows
+        self.sparse_threshold = 0.25
+        # "per_cell" draws one noise sample per cell; "aggregated" draws one per column
+        self.noise_mode = "per_cell"
+        # Optional stacked read-noise stages; replaces the device's own read noise
+        self.noise_pipeline: NoisePipeline = None
+        # Noiseless column currents of recently read input vectors (LRU);
+        # read_cache_size = 0 disables memoization
+        self.read_cache_size = 256
+        self.read_cache_stats = {"hits": 0, "misses": 0}
+        self._read_cache = OrderedDict()
+        self._read_cache_key = None
+        # Read settings the ADC was last calibrated for (see _adc_settings)
+        self._adc_calibration_key = None
+        self.calibrate_adc()
+
+    @property
+    def adc_bits(self) -> int:
+        """ADC resolution."""
+        return self.adc.bits
+
+    @adc_bits.setter
+    def adc_bits(self, bits: int):
+        self.adc.bits = bits
+
+    @property
+    def conductances(self) -> np.ndarray:
+        """
+        Current cell conductances (size x physical_columns), in the compute dtype.
+        In MLC mode they are looked up from the level codes on each access.
+        """
+        if self.level_codes is None:
+            return self._load(self._conductances)
+        if self.drift_epochs is None:
+            return self.level_table[0][self.level_codes]
+        return self.level_table[self.drift_epochs, self.level_codes]
+
+    @conductances.setter
+    def conductances(self, value: np.ndarray):
+        # Always assign whole arrays so cached derived state is invalidated
+        self._conductances = self._store(value)
+        self._conductances_changed()
+
+    @property
+    def programmed_conductances(self) -> np.ndarray:
+        """As-programmed (undrifted) conductances, in the compute dtype."""
+        return self._load(self._programmed)
+
+    @programmed_conductances.setter
+    def programmed_conductances(self, value: np.ndarray):
+        self._programmed = self._store(value)
+
+    def _set_programmed(self, conductances: np.ndarray):
+        """Store freshly programmed conductances as both programmed and current state."""
+        self._programmed = self._store(conductances)
+        self._conductances = self._programmed
+        self._conductances_changed()
+
+    def _store(self, conductances: np.ndarray) -> np.ndarray:
+        """Convert conductances (S) to the storage dtype and unit."""
+        if conductances is None or self.precision.full_width_storage:
+            return conductances
+        return self.precision.store(conductances / self._conductance_unit)
+
+    def _load(self, stored: np.ndarray) -> np.ndarray:
+        """Convert stored conductances back to siemens in the compute dtype."""
+        if stored is None or self.precision.full_width_storage:
+            return stored
+        return self.precision.load(stored) * self.precision.compute_dtype.type(self._conductance_unit)
+
+    def _conductances_changed(self):
+        self.conductance_version += 1
+        self._column_noise_moments = None
+
+    @property
+    def state_nbytes(self) -> int:
+        """
+        Bytes held by per-cell arrays: conductance state (or MLC codes and
+        level table), drift epochs, logical weights, write counts, and any
+        attached fault or variation map.
+        """
+        arrays = [self._conductances, self._programmed, self.level_codes, self.level_table,
+                  self.drift_epochs, self._weight_store, self.write_counts]
+        if self.fault_map is not None:
+            fault_map = self.fault_map
+            arrays += [fault_map.faulty, fault_map.stuck_at_max, fault_map.stuck_at_min,
+                       fault_map.stuck_conductance]
+        if self.variation_map is not None:
+            arrays += [self.variation_map.gain, self.variation_map.offset]
+        unique = {id(a): a for a in arrays if a is not None}
+        return sum(a.nbytes for a in unique.values())
+
+    @property
+    def weights(self) -> np.ndarray:
+        """
+        Logical weights as held for programming (size x output_size): values
+        beyond weight_scale read back saturated, sliced weights at their
+        weight_bits precision.
+        """
+        return self._normalized_weights() * self.weight_scale
+
+    @property
+    def _weight_dtype(self) -> np.dtype:
+        """Smallest dtype that holds the logical weight store exactly."""
+        if self.weight_slicer is None:
+            return self.precision.storage_dtype
+        max_code = self.weight_slicer.max_code
+        return np.min_scalar_type(-max_code if self.differential else max_code)
+
+    def _encode_weights(self, weights: np.ndarray) -> np.ndarray:
+        """Weights in the store's form at the current weight_scale."""
+        normalized = np.clip(np.asarray(weights, dtype=float) / self.weight_scale, -1, 1)
+        if self.weight_slicer is None:
+            return self.precision.store(normalized)
+        codes = self.weight_slicer.quantize(np.abs(normalized))
+        if self.differential:
+            codes = np.where(normalized < 0, -codes, codes)
+        else:
+            codes = np.where(normalized < 0, 0, codes)
+        return codes.astype(self._weight_dtype)
+
+    def _normalized_weights(self) -> np.ndarray:
+        """Stored weights / weight_scale, as float64."""
+        if self.weight_slicer is None:
+            return self._weight_store.astype(float)
+        return self._weight_store / float(self.weight_slicer.max_code)
 
     def program_weights(self, weight_matrix: np.ndarray):
         """
         Program conductance values to crossbar.
         Weights are normalized to [0, 1] and mapped to conductance.
+        In differential mode weights are normalized by max |w| and split
+        into positive and negative parts on the G+ and G- planes.
+
+        With a weight slicer, each weight is split into slices on
+        adjacent physical columns.
 
         Args:
-            weight_matrix: Input weights (size x size)
+            weight_matrix: Input weights (size x output_size)
         """
-        assert weight_matrix.shape == (self.size, self.size)
-        self.weights = weight_matrix.copy()
+        if weight_matrix.shape != (self.size, self.output_size):
+            raise ValueError(
+                f"Weight matrix shape {weight_matrix.shape} does not match crossbar "
+                f"({self.size}, {self.output_size})"
+            )
+        # Normalize to [0, 1] (by max |w| for differential pairs)
+        if self.differential:
+            scale = np.abs(weight_matrix).max()
+        else:
+            scale = weight_matrix.max()
+        self.weight_scale = float(scale) if scale > 0 else 1.0
+        self._weight_store = self._encode_weights(weight_matrix)
 
-        # Normalize to [0, 1]
-        if weight_matrix.max() > 0:
-            normalized = weight_matrix / weight_matrix.max()
+        self.drift_age = 0.0
+        self.drift_epochs = None
+        self.epoch_ages = np.zeros(1)
+        if self.mlc is not None:
+            self._program_levels()
         else:
-            normalized = weight_matrix
+            self._set_programmed(self._apply_faults(self._program_cells(self._targets())))
+        self.calibrate_adc()
+
+    def program_region(self, weight_block: np.ndarray, row_start: int, col_start: int):
+        """
+        Reprogram a block of logical weights, leaving other cells unwritten.
+        The block is mapped with the scale of the last program_weights
+        (values beyond it saturate). The written cells start a new drift
+        epoch; unwritten cells keep their programmed state and drift age.
 
-        # Program each device
-        for i in range(self.size):
-            for j in range(self.size):
-                target_conductance = normalized[i, j] * self.device_model.max_conductance
-                self.devices[i][j].program(target_conductance)
+        Args:
+            weight_block: Weights (rows, cols) for the block
+            row_start: First crossbar row of the block
+            col_start: First logical column of the block
+        """
+        rows, cols = weight_block.shape
+        if row_start + rows > self.size or col_start + cols > self.output_size:
+            raise ValueError(
+                f"Block {weight_block.shape} at ({row_start}, {col_start}) exceeds crossbar "
+                f"({self.size}, {self.output_size})"
+            )
+        region = (slice(row_start, row_start + rows), slice(col_start, col_start + cols))
+        self._weight_store[region] = self._encode_weights(weight_block)
+
+        logical_mask = np.zeros((self.size, self.output_size), dtype=bool)
+        logical_mask[region] = True
+        mask = self._physical_mask(logical_mask)
+
+        self.drift_age = 0.0
+        if self.mlc is not None:
+            self._program_levels(mask)
+        else:
+            written = self._program_cells(self._targets(), mask)
+            self._start_epoch(mask)
+            self.programmed_conductances = self._apply_faults(
+                np.where(mask, written, self.programmed_conductances)
+            )
+            self._refresh_drift()
+        self.calibrate_adc()
+
+    def _targets(self) -> np.ndarray:
+        """
+        Conductance targets for the stored logical weights.
+        In differential mode positive and negative parts go to the G+ and
+        G- planes; with a weight slicer each weight code is split into
+        slices on adjacent physical columns.
+        """
+        if self.weight_slicer is None:
+            weights = self._weight_store.astype(float)
+        else:
+            weights = self._weight_store.astype(np.int64)
+        if self.differential:
+            planes = [np.maximum(weights, 0), np.maximum(-weights, 0)]
+        else:
+            planes = [weights]
+        normalized = np.hstack([self._map_plane(plane) for plane in planes])
+        return normalized * self.device_model.max_conductance
+
+    def _physical_mask(self, logical_mask: np.ndarray) -> np.ndarray:
+        """Expand a (size, output_size) cell mask to every physical cell it maps to."""
+        plane = np.repeat(logical_mask, self.num_slices, axis=1)
+        return np.hstack([plane] * self.num_planes)
+
+    def _program_cells(self, targets: np.ndarray, mask: np.ndarray = None) -> np.ndarray:
+        """
+        Program target conductances, counting one write per pulse.
+        Each pulse draws the device's cycle-to-cycle variation, then the
+        cell's fixed device-to-device gain/offset and wear degradation are
+        applied when a variation map and endurance model are set.
+
+        In "write_verify" mode every pending cell gets a programming pulse,
+        then a verify read; cells within tolerance drop out of the pending
+        mask and the rest are pulsed again, up to max_pulses. With a
+        variation map or endurance model the error has a fixed per-cell
+        part, so each re-pulse target is moved against the measured error
+        (cells it pushes out of reach still use up max_pulses). Each
+        iteration is a few whole-array operations over the pending cells.
+
+        Args:
+            targets: Target conductances (size, physical_columns)
+            mask: Cells actually written (None writes every cell)
+
+        Returns:
+            Programmed conductances (entries outside mask are meaningless)
+        """
+        g_min, g_max = self.device_model.min_conductance, self.device_model.max_conductance
+        clipped = np.clip(targets, g_min, g_max)
+        verify = self.program_mode == "write_verify"
+        pending = np.ones(targets.shape, dtype=bool) if mask is None else mask.copy()
+        programmed = np.zeros_like(targets)
+        compensate = verify and (self.variation_map is not None or self.endurance_model is not None)
+        pulse_targets = np.array(targets, dtype=float)
+        # Per-cell sign of the last measured error and count of sign flips
+        error_sign = np.zeros(targets.shape)
+        flips = np.ones(targets.shape)
+        stats = {"pulses": 0, "verify_reads": 0, "row_steps": 0, "iterations": 0}
+
+        for _ in range(self.max_pulses if verify else 1):
+            if not pending.any():
+                break
+            cells = np.nonzero(pending)
+            self.write_counts[cells] += 1
+            written = self.device_model.program_array(pulse_targets[cells], self.rng)
+            if self.variation_map is not None:
+                written = self.variation_map.apply(written, g_min, g_max, cells)
+            if self.endurance_model is not None:
+                written = self.endurance_model.apply(
+                    written, clipped[cells], self.write_counts[cells], g_min, g_max
+                )
+            programmed[cells] = written
+
+            # Rows are pulsed one at a time, all pending columns in parallel
+            stats["pulses"] += written.size
+            stats["row_steps"] += int(np.count_nonzero(pending.any(axis=1)))
+            stats["iterations"] += 1
+            if verify:
+                stats["verify_reads"] += written.size
+                pending[cells] = np.abs(written - clipped[cells]) > self.verify_tolerance * g_max
+            if compensate:
+                # Step against the measured error, shrinking the step each time
+                # the error changes sign: a persistent (fixed or clipped) error
+                # is removed at full gain, cycle-to-cycle noise averages out
+                error = written - clipped[cells]
+                sign = np.sign(error)
+                flips[cells] += (sign * error_sign[cells]) < 0
+                error_sign[cells] = sign
+                pulse_targets[cells] = np.clip(pulse_targets[cells] - error / flips[cells], g_min, g_max)
+
+        stats["unconverged"] = int(np.count_nonzero(pending)) if verify else 0
+        self.program_stats = stats
+        return programmed
+
+    def set_mlc_levels(self, mlc: MLCLevels):
+        """
+        Switch to multi-level cell storage. The current state is snapped
+        to the nearest levels and the float conductance arrays are released.
+
+        Args:
+            mlc: Level table and per-level spread
+        """
+        self.mlc = mlc
+        self.level_codes = mlc.quantize(self.programmed_conductances)
+        self._programmed = None
+        self._conductances = None
+        self._pin_fault_codes()
+        self._refresh_level_table()
+        self.calibrate_adc()
+
+    def _program_levels(self, mask: np.ndarray = None):
+        """
+        MLC programming: snap targets to level codes in one operation.
+        Levels are exactly reachable, so each written cell takes one pulse.
+
+        Args:
+            mask: Cells actually written (None writes every cell)
+        """
+        codes = self.mlc.quantize(self._targets())
+        if mask is None:
+            self.write_counts += 1
+            written, row_steps = codes.size, self.size
+        else:
+            codes = np.where(mask, codes, self.level_codes)
+            self._start_epoch(mask)
+            self.write_counts += mask
+            written, row_steps = int(np.count_nonzero(mask)), int(np.count_nonzero(mask.any(axis=1)))
+        self.program_stats = {
+            "pulses": written, "verify_reads": 0, "row_steps": row_steps,
+            "iterations": 1, "unconverged": 0,
+        }
+        self.level_codes = codes
+        self._pin_fault_codes()
+        self._refresh_level_table()
+
+    def _start_epoch(self, mask: np.ndarray):
+        """
+        Move the cells in mask to a new drift epoch of age 0. Epochs that
+        no cell uses any more are dropped and epochs of equal age merged,
+        so a region written before any drift adds no epoch.
+        """
+        if self.drift_epochs is None:
+            epochs = np.zeros(mask.shape, dtype=np.uint8)
+        else:
+            epochs = self.drift_epochs
+        ages = np.append(self.epoch_ages, 0.0)
+        epochs = np.where(mask, len(ages) - 1, epochs)
+        used = np.flatnonzero(np.bincount(epochs.ravel(), minlength=len(ages)))
+        unique_ages, merged = np.unique(ages[used], return_inverse=True)
+        if len(unique_ages) > np.iinfo(np.uint8).max + 1:
+            raise ValueError("More than 256 drift epochs; reprogram the whole array")
+        remap = np.zeros(len(ages), dtype=np.uint8)
+        remap[used] = merged
+        self.epoch_ages = unique_ages
+        self.drift_epochs = None if len(unique_ages) == 1 else remap[epochs]
+
+    def _pin_fault_codes(self):
+        """Point stuck cells at the two stuck entries after the MLC levels."""
+        if self.fault_map is None:
+            return
+        n = self.mlc.n_levels
+        stuck = np.where(self.fault_map.stuck_at_max, n + 1, n).astype(np.uint8)
+        self.level_codes = np.where(self.fault_map.faulty, stuck, self.level_codes)
+
+    def _refresh_level_table(self):
+        """
+        Rebuild the level table, one row per drift epoch. Drift depends
+        only on the as-programmed level and the epoch's age, so it acts on
+        n_levels entries per epoch instead of every cell; stuck-at entries
+        do not drift.
+        """
+        stuck = [self.device_model.min_conductance, self.device_model.max_conductance]
+        rows = [np.concatenate([self.device_model.drift_array(self.mlc.levels, age), stuck])
+                for age in self.epoch_ages]
+        self.level_table = self.precision.load(np.array(rows))
+        self._conductances_changed()
+
+    def get_wear(self) -> np.ndarray:
+        """Fraction of endurance used per physical cell (needs an endurance model)."""
+        return self.endurance_model.wear(self.write_counts)
+
+    def _map_plane(self, plane: np.ndarray) -> np.ndarray:
+        """Map one plane of stored weights onto normalized physical cell targets."""
+        if self.weight_slicer is None:
+            return plane
+        return self.weight_slicer.slice_codes(plane)
+
+    def calibrate_adc(self):
+        """
+        Calibrate per-column ADC gain/offset for the programmed state.
+        Full scale is each column's current with every row driven at
+        read_voltage; the offset is the column's mean read-noise current.
+        """
+        full_input = np.full(self.size, self.read_voltage)
+        full_scale = self.device_model.read_columns(self.conductances, full_input)
+        offset = np.zeros(self.physical_columns)
+        if self.noise_pipeline is None:
+            try:
+                noise_mean, _ = self.device_model.noise_moments(self.conductances)
+                offset = noise_mean.sum(axis=0)
+            except NotImplementedError:
+                pass
+        if self.ir_drop_enabled and self.ir_drop_model == "simple":
+            full_scale, offset = full_scale * 0.95, offset * 0.95
+        self.adc.calibrate(full_scale + offset, offset)
+        self._adc_calibration_key = self._adc_settings()
+
+    def _adc_settings(self) -> tuple:
+        """
+        Read settings the calibration depends on. Reads recalibrate when
+        any of them changed since the last calibration; drift alone does
+        not, so drifted conductances still show up as ADC error.
+        """
+        return (self.ir_drop_enabled, self.ir_drop_model, self.read_voltage, id(self.noise_pipeline))
 
     def read_outputs(self, input_vector: np.ndarray) -> np.ndarray:
         """
@@ -56,34 +532,342 @@ class CrossbarArray:
             input_vector: Input voltages (size,)
 
         Returns:
-            Output currents (size,)
+            Output currents (output_size,)
         """
         assert input_vector.shape == (self.size,)
-        outputs = np.zeros(self.size)
 
-        for j in range(self.size):  # Output lines
-            for i in range(self.size):  # Input lines
-                current = self.devices[i][j].read(input_vector[i])
-                noise = self.devices[i][j].inject_noise()
-                outputs[j] += current + noise
+        # No active inputs: no row is driven, so crossbar and ADC stay idle
+        if not np.any(input_vector):
+            return np.zeros(self.output_size, dtype=self.precision.compute_dtype)
+
+        return self.read_outputs_batch(input_vector[None, :])[0]
+
+    def read_outputs_batch(self, input_matrix: np.ndarray) -> np.ndarray:
+        """
+        Read crossbar output currents for a whole input train at once.
+        Currents do not depend on neuron state, so all live timesteps are
+        computed as one (T, size) @ (size, physical_columns) product, with noise,
+        IR drop and ADC quantization applied to the result in bulk.
+        When the rows driven anywhere in the train are sparse, the product
+        gathers only those rows; all-zero timesteps skip the crossbar and ADC.
+
+        Args:
+            input_matrix: Input voltages (timesteps, size)
+
+        Returns:
+            Output currents (timesteps, output_size)
+        """
+        assert input_matrix.ndim == 2 and input_matrix.shape[1] == self.size
+        if self.input_mode == "bit_serial":
+            return self._logical_outputs(self._read_bit_serial(input_matrix))
+        return self._logical_outputs(self._read_analog_batch(input_matrix))
+
+    def bit_planes(self, input_matrix: np.ndarray) -> np.ndarray:
+        """
+        Slice inputs into dac_bits binary planes (LSB first).
+        Inputs are quantized over [0, read_voltage]; negative values clip to 0.
 
-        # IR drop effect (simplified)
-        if self.ir_drop_enabled:
-            outputs *= 0.95
+        Args:
+            input_matrix: Input voltages (batch, size)
 
-        # ADC quantization
-        outputs = self._quantize_adc(outputs)
+        Returns:
+            Binary planes (batch, dac_bits, size)
+        """
+        levels = (1 << self.dac_bits) - 1
+        codes = np.clip(np.round(input_matrix / self.read_voltage * levels), 0, levels).astype(np.int64)
+        shifts = np.arange(self.dac_bits)[:, None]
+        return (codes[:, None, :] >> shifts) & 1
 
+    def _read_bit_serial(self, input_matrix: np.ndarray) -> np.ndarray:
+        """
+        Bit-serial read: every binary plane of every input goes through the
+        crossbar and ADC as one batched read, then the digitized partial
+        results are shift-added.
+        """
+        planes = self.bit_planes(input_matrix)
+        batch, bits, size = planes.shape
+        plane_outputs = self._read_analog_batch(
+            planes.reshape(batch * bits, size) * self.read_voltage
+        ).reshape(batch, bits, -1)
+        place_values = (1 << np.arange(bits)) / ((1 << bits) - 1)
+        return np.tensordot(place_values, plane_outputs, axes=([0], [1]))
+
+    def _read_analog_batch(self, input_matrix: np.ndarray) -> np.ndarray:
+        """Analog batched read; all-zero rows skip the crossbar and ADC."""
+        input_matrix = self.precision.load(input_matrix)
+        outputs = np.zeros((input_matrix.shape[0], self.physical_columns), dtype=self.precision.compute_dtype)
+        live = np.any(input_matrix, axis=1)
+        if not live.any():
+            return outputs
+
+        if self.noise_pipeline is None:
+            live_outputs = self._device_noise_currents(input_matrix[live])
+        elif len(self.noise_pipeline):
+            live_outputs = self._pipeline_currents(input_matrix[live])
+        else:
+            # An empty pipeline replaces the device's read noise with none
+            live_outputs = self._deterministic_currents(input_matrix[live])
+        if self.mlc is not None and self.mlc.sigma.any():
+            live_outputs = live_outputs + self._level_spread_noise(input_matrix[live])
+
+        if self.ir_drop_enabled and self.ir_drop_model == "simple":
+            live_outputs *= 0.95
+
+        outputs[live] = self._quantize_adc(live_outputs)
         return outputs
 
+    def _device_noise_currents(self, input_matrix: np.ndarray) -> np.ndarray:
+        """
+        Column currents plus the device model's read noise.
+        Only the noise is drawn per read; a noise-free device adds nothing,
+        so repeated inputs never reach the crossbar again.
+
+        Args:
+            input_matrix: Drive voltages of live reads (reads, size)
+
+        Returns:
+            Column currents (reads, physical_columns)
+        """
+        outputs = self._deterministic_currents(input_matrix)
+        if self._device_noise_free():
+            return outputs
+        return outputs + self._column_noise(input_matrix.shape[0])
+
+    def _device_noise_free(self) -> bool:
+        """True when the device's read noise has zero mean and variance."""
+        try:
+            mean, std = self._aggregated_noise_params()
+        except NotImplementedError:
+            return False
+        return not (mean.any() or std.any())
+
+    def _deterministic_currents(self, input_matrix: np.ndarray) -> np.ndarray:
+        """
+        Noiseless column currents, memoized per (input content, conductance
+        version). A static input held over many timesteps repeats the same
+        vector, so each distinct vector is read through the crossbar once;
+        programming, drift, faults and IR-drop model or wire resistance
+        changes start a fresh cache. Batches are deduplicated by runs of
+        equal consecutive rows (one comparison pass); a batch with no such
+        run is read directly, without hashing any rows.
+
+        Args:
+            input_matrix: Drive voltages of live reads (reads, size)
+
+        Returns:
+            Column currents (reads, physical_columns)
+        """
+        if self.read_cache_size <= 0:
+            return self._noiseless_currents(input_matrix)
+        run_starts = np.ones(len(input_matrix), dtype=bool)
+        run_starts[1:] = np.any(input_matrix[1:] != input_matrix[:-1], axis=1)
+        if len(input_matrix) > 1 and run_starts.all():
+            return self._noiseless_currents(input_matrix)
+        wire_resistance = self.ir_solver.wire_resistance if self._nodal_ir_drop else None
+        cache_key = (self.conductance_version, self._nodal_ir_drop, wire_resistance)
+        if self._read_cache_key != cache_key:
+            self._read_cache.clear()
+            self._read_cache_key = cache_key
+
+        unique, inverse = input_matrix[run_starts], np.cumsum(run_starts) - 1
+        digests = [hashlib.blake2b(row.tobytes(), digest_size=16).digest() for row in unique]
+        missing = [i for i, digest in enumerate(digests) if digest not in self._read_cache]
+        if missing:
+            for i, currents in zip(missing, self._noiseless_currents(unique[missing])):
+                self._read_cache[digests[i]] = currents
+        self.read_cache_stats["hits"] += input_matrix.shape[0] - len(missing)
+        self.read_cache_stats["misses"] += len(missing)
+
+        currents = np.empty((len(unique), self.physical_columns), dtype=self.precision.compute_dtype)
+        for i, digest in enumerate(digests):
+            currents[i] = self._read_cache[digest]
+            self._read_cache.move_to_end(digest)
+        while len(self._read_cache) > self.read_cache_size:
+            self._read_cache.popitem(last=False)
+        return currents[inverse]
+
+    def _noiseless_currents(self, input_matrix: np.ndarray) -> np.ndarray:
+        """
+        Noiseless column currents through the crossbar in one product.
+        The rows driven by any read in the batch are gathered once; a sparse
+        single read or a low-activity batch touches only those rows.
+
+        Args:
+            input_matrix: Drive voltages (reads, size)
+
+        Returns:
+            Column currents (reads, physical_columns)
+        """
+        if self._nodal_ir_drop:
+            # One factorization, all live timesteps as a multi-column RHS
+            return self._nodal_currents(input_matrix)
+        active_rows = np.flatnonzero(np.any(input_matrix, axis=0))
+        return self._column_currents(input_matrix, active_rows)
+
+    def _level_spread_noise(self, input_matrix: np.ndarray) -> np.ndarray:
+        """
+        Read-time spread of MLC levels around their nominal conductance.
+        Cell deviations are independent Gaussians with their level's sigma,
+        so each column's sum is drawn directly with std sqrt(V^2 @ sigma^2)
+        (first order in the device I-V).
+
+        Args:
+            input_matrix: Drive voltages of live reads (reads, size)
+
+        Returns:
+            Current noise (reads, physical_columns)
+        """
+        sigma = np.concatenate([self.mlc.sigma, [0.0, 0.0]])[self.level_codes]
+        std = np.sqrt((input_matrix ** 2) @ (sigma ** 2))
+        return std * self.rng.standard_normal(std.shape)
+
+    def _pipeline_currents(self, input_matrix: np.ndarray) -> np.ndarray:
+        """
+        Column currents through per-read noisy conductances.
+        The noise pipeline perturbs a (reads, size, physical_columns) stack
+        of cell conductances in one pass per stage, then every cell current
+        is evaluated at its (IR-dropped, if nodal) voltage and summed.
+
+        Args:
+            input_matrix: Drive voltages of live reads (reads, size)
+
+        Returns:
+            Column currents (reads, physical_columns)
+        """
+        cells = np.broadcast_to(self.conductances, (input_matrix.shape[0],) + self.conductances.shape)
+        cells = self.noise_pipeline.apply(cells, self.rng)
+        if self._nodal_ir_drop:
+            self.ir_solver.factorize(self.conductances, self.conductance_version)
+            cell_voltages = self.ir_solver.cell_voltages(input_matrix)
+        else:
+            cell_voltages = input_matrix[:, :, None]
+        return self.device_model.read_array(cells, cell_voltages).sum(axis=1)
+
     def update_drift(self, time_elapsed: float):
-        """Update all devices for temporal drift."""
-        for i in range(self.size):
-            for j in range(self.size):
-                self.devices[i][j].update_drift(time_elapsed)
+        """
+        Update all devices for temporal drift.
+        Conductance is evaluated in closed form at each cell's time since
+        programming, so one call costs the same for 1 ms as for 10 years.
+        """
+        self.drift_age += time_elapsed
+        self.epoch_ages = self.epoch_ages + time_elapsed
+        if self.mlc is not None:
+            self._refresh_level_table()
+        else:
+            self._refresh_drift()
+
+    def _refresh_drift(self):
+        """Drift the programmed conductances of each epoch by the epoch's age."""
+        programmed = self.programmed_conductances
+        if self.drift_epochs is None:
+            drifted = self.device_model.drift_array(programmed, self.epoch_ages[0])
+        else:
+            drifted = np.empty_like(programmed)
+            for epoch, age in enumerate(self.epoch_ages):
+                cells = self.drift_epochs == epoch
+                drifted[cells] = self.device_model.drift_array(programmed[cells], age)
+        self.conductances = self._apply_faults(drifted)
+
+    def set_fault_map(self, fault_map: StuckAtFaultMap):
+        """
+        Attach stuck-at fault masks; faulty cells are pinned to Gmin/Gmax
+        in the current state and on every later program and drift update.
+        """
+        self.fault_map = fault_map
+        if self.mlc is not None:
+            self._pin_fault_codes()
+            self._refresh_level_table()
+        else:
+            self.programmed_conductances = self._apply_faults(self.programmed_conductances)
+            self.conductances = self._apply_faults(self.conductances)
+        self.calibrate_adc()
+
+    def _apply_faults(self, conductances: np.ndarray) -> np.ndarray:
+        """Pin faulty cells with a single np.where over the array."""
+        if self.fault_map is None:
+            return conductances
+        return self.fault_map.apply(conductances)
+
+    def _column_currents(self, input_vector: np.ndarray, active_rows: np.ndarray = None) -> np.ndarray:
+        """
+        Noiseless column currents: sum_i I(G_ij, V_i), for one input (size,)
+        or a batch (reads, size). When the active rows are known and sparse
+        enough, only those conductance rows are gathered (event-driven read).
+        """
+        if active_rows is not None and active_rows.size < self.sparse_threshold * self.size:
+            return self.device_model.read_columns(
+                self.conductances[active_rows], input_vector[..., active_rows]
+            )
+        return self.device_model.read_columns(self.conductances, input_vector)
+
+    def _logical_outputs(self, outputs: np.ndarray) -> np.ndarray:
+        """
+        Turn digitized physical column outputs into logical outputs:
+        I+ - I- for differential pairs, then shift-add of weight slices.
+        """
+        if self.differential:
+            outputs = outputs[..., : self.plane_columns] - outputs[..., self.plane_columns :]
+        if self.weight_slicer is None:
+            return outputs
+        return self.weight_slicer.combine(outputs, self.output_size)
+
+    @property
+    def _nodal_ir_drop(self) -> bool:
+        return self.ir_drop_enabled and self.ir_drop_model == "nodal"
+
+    def _nodal_currents(self, input_matrix: np.ndarray) -> np.ndarray:
+        """
+        Column currents with resistive-network IR drop.
+        The nodal matrix is factorized once per conductance version (i.e.
+        again only after programming or drift); each cell's current is then
+        evaluated from its actual voltage, so device nonlinearity is kept.
+
+        Args:
+            input_matrix: Drive voltages (batch, size)
+
+        Returns:
+            Column currents (batch, physical_columns)
+        """
+        self.ir_solver.factorize(self.conductances, self.conductance_version)
+        cell_voltages = self.ir_solver.cell_voltages(input_matrix)
+        return self.device_model.read_array(self.conductances, cell_voltages).sum(axis=1)
+
+    def _column_noise(self, num_reads: int = None) -> np.ndarray:
+        """
+        Read noise summed along each output column.
+        With num_reads, returns independent noise for that many reads (num_reads, physical_columns).
+
+        In "aggregated" mode the per-cell noise of a column, a sum of
+        independent samples, is drawn directly as one Gaussian with the
+        column's summed mean and variance. This is exact for Gaussian cell
+        noise (ReRAM/SRAM) and a central-limit approximation otherwise (PCM).
+        """
+        if self.noise_mode == "aggregated":
+            mean, std = self._aggregated_noise_params()
+            shape = (self.physical_columns,) if num_reads is None else (num_reads, self.physical_columns)
+            return mean + std * self.rng.standard_normal(shape)
+
+        if num_reads is None:
+            return self.device_model.noise_array(self.conductances, self.rng).sum(axis=0)
+        cells = np.broadcast_to(self.conductances, (num_reads,) + self.conductances.shape)
+        return self.device_model.noise_array(cells, self.rng).sum(axis=1)
+
+    def _aggregated_noise_params(self):
+        """Per-column noise mean and std, cached until conductances change."""
+        if self._column_noise_moments is None:
+            mean, var = self.device_model.noise_moments(self.conductances)
+            self._column_noise_moments = (mean.sum(axis=0), np.sqrt(var.sum(axis=0)))
+        return self._column_noise_moments
 
     def _quantize_adc(self, values: np.ndarray) -> np.ndarray:
         """Quantize to ADC resolution."""
-        max_val = values.max() if values.max() > 0 else 1.0
+        if self.adc_mode == "calibrated":
+            if self._adc_calibration_key != self._adc_settings():
+                self.calibrate_adc()
+            return self.adc.convert(values)
+
+        # Legacy dynamic mode: each read is scaled by its own maximum
+        max_val = values.max(axis=-1, keepdims=True)
+        max_val = np.where(max_val > 0, max_val, 1.0)
         levels = (1 << self.adc_bits) - 1
         return np.round(values / max_val * levels) / levels * max_val
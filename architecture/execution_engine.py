@@ -60,30 +60,31 @@ class ExecutionEngine:
         if weights is not None:
             tile.program_weights(weights)
 
-        outputs = []
         stats = {
             "total_spikes": 0,
             "energy_consumed": 0,
             "spike_rate": 0,
         }
 
-        for t in range(timesteps):
-            if inputs.ndim == 1:
-                input_vec = inputs
-            else:
-                input_vec = inputs[t] if t < inputs.shape[0] else np.zeros(inputs.shape[1])
+        if inputs.ndim == 1:
+            input_train = np.broadcast_to(inputs, (timesteps, inputs.shape[0]))
+        else:
+            # Steps beyond the provided train receive zero input
+            input_train = np.zeros((timesteps, inputs.shape[1]))
+            n = min(timesteps, inputs.shape[0])
+            input_train[:n] = inputs[:n]
 
-            spike_out = tile.execute_layer(input_vec, dt=1.0)
-            outputs.append(spike_out)
+        # The tile manager advances simulation time by the executed steps
+        outputs = self.tile_manager.execute_batch(tile_id, input_train, dt=1.0)
 
         # Aggregate statistics
         stats["total_spikes"] = sum(len(out) for out in outputs)
         stats["energy_consumed"] = tile.power_monitor.get_total_energy()
-        stats["spike_rate"] = stats["total_spikes"] / (timesteps * tile.size)
+        stats["spike_rate"] = stats["total_spikes"] / (timesteps * tile.neurons.size)
 
         # Track synaptic MAC operations: each timestep processes active_inputs × crossbar_columns
         active_inputs = int(np.sum(np.abs(inputs if inputs.ndim == 1 else inputs[0]) > 0))
-        ops_this_run = timesteps * active_inputs * tile.size
+        ops_this_run = timesteps * active_inputs * tile.crossbar.physical_columns
         self.total_ops += ops_this_run
         stats["total_ops"] = ops_this_run
 
@@ -127,6 +128,7 @@ class ExecutionEngine:
         return {
             "total_energy_mj": power_data["total_energy"],
             "per_tile": power_data["per_tile"],
+            "resident_tiles": power_data["resident_tiles"],
             "efficiency_ops_per_mj": self._estimate_efficiency(),
         }
 
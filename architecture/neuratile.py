@@ -5,36 +5,80 @@ Combines crossbar array, neuron cluster, and local scheduling.
 
 import numpy as np
 from architecture.crossbar_array import CrossbarArray
+from architecture.weight_slicing import WeightSlicer
 from architecture.neuron_cluster import NeuronCluster
-from device_layer.base_device import DeviceModel
+from architecture.precision import PrecisionPolicy
+from device_layer.base_device import DeviceEnergy, DeviceModel
 
 
 class NeuraTile:
     """Single compute tile with local crossbar and neurons."""
 
-    def __init__(self, tile_id: int, size: int, device_model: DeviceModel):
+    def __init__(self, tile_id: int, size: int, device_model: DeviceModel,
+                 rng: np.random.Generator = None, weight_slicer: WeightSlicer = None,
+                 differential: bool = False, cols: int = None, precision: PrecisionPolicy = None):
         """
         Args:
             tile_id: Unique tile identifier
-            size: Crossbar size (size x size)
+            size: Crossbar rows (inputs); also the column count unless cols is given
             device_model: Device model for this tile
+            rng: Tile-private generator (see device_layer.random_streams)
+            weight_slicer: Optional bit-slicing of high-precision weights
+            differential: Use G+/G- conductance pairs for signed weights
+            cols: Logical crossbar columns (outputs); defaults to size
+            precision: Storage/compute dtypes for the crossbar state
         """
         self.tile_id = tile_id
         self.size = size
-        self.crossbar = CrossbarArray(size, device_model)
-        self.neurons = NeuronCluster(size)
-        self.power_monitor = TilePowerMonitor()
+        self.rng = rng
+        self.crossbar = CrossbarArray(
+            size, device_model, rng=rng, weight_slicer=weight_slicer, differential=differential,
+            cols=cols, precision=precision,
+        )
+        self.cols = self.crossbar.cols
+        # One neuron per logical output column
+        self.neurons = NeuronCluster(self.crossbar.output_size)
+        self.power_monitor = TilePowerMonitor(self.crossbar.device_model.energy)
         self.local_spikes = []
         self.input_spikes = []
+        self.drift_enabled = True
+        # Simulation time (ms) up to which device drift has been applied
+        self.last_update_time = 0.0
+
+    def sync_to(self, sim_time: float):
+        """
+        Bring device state up to sim_time, applying drift in bulk for the
+        simulated time since this tile was last touched.
+
+        Args:
+            sim_time: Current simulation time (ms)
+        """
+        elapsed = sim_time - self.last_update_time
+        if elapsed > 0 and self.drift_enabled:
+            self.crossbar.update_drift(elapsed)
+        self.last_update_time = max(self.last_update_time, sim_time)
 
     def program_weights(self, weight_matrix: np.ndarray):
         """
         Program weights into crossbar.
 
         Args:
-            weight_matrix: Weight matrix (size x size)
+            weight_matrix: Weight matrix (size x crossbar.output_size)
         """
         self.crossbar.program_weights(weight_matrix)
+        self.power_monitor.add_programming(self.crossbar.program_stats)
+
+    def program_region(self, weight_block: np.ndarray, row_start: int, col_start: int):
+        """
+        Reprogram a block of weights in place.
+
+        Args:
+            weight_block: Weights for the block
+            row_start: First crossbar row
+            col_start: First logical column
+        """
+        self.crossbar.program_region(weight_block, row_start, col_start)
+        self.power_monitor.add_programming(self.crossbar.program_stats)
 
     def execute_layer(self, input_vector: np.ndarray, dt: float = 1.0) -> np.ndarray:
         """
@@ -51,7 +95,10 @@ class NeuraTile:
         output_currents = self.crossbar.read_outputs(input_vector)
 
         # Update power monitor
-        self.power_monitor.add_activity(output_currents, input_vector)
+        self.power_monitor.add_activity(
+            output_currents, input_vector, self._plane_activity(input_vector),
+            n_columns=self.crossbar.physical_columns,
+        )
 
         # Neuron integration
         spikes = self.neurons.integrate(output_currents, dt)
@@ -59,9 +106,48 @@ class NeuraTile:
 
         return np.array(spikes)
 
+    def execute_layer_batch(self, input_matrix: np.ndarray, dt: float = 1.0) -> list:
+        """
+        Execute a whole input train: one batched crossbar read, then the
+        sequential LIF recurrence over timesteps.
+
+        Args:
+            input_matrix: Input spike/current train (timesteps, size)
+            dt: Time step
+
+        Returns:
+            List of spike index arrays, one per time step
+        """
+        output_currents = self.crossbar.read_outputs_batch(input_matrix)
+
+        plane_activity = self._plane_activity(input_matrix)
+
+        outputs = []
+        for t, (input_vector, currents) in enumerate(zip(input_matrix, output_currents)):
+            planes = None if plane_activity is None else plane_activity[t]
+            self.power_monitor.add_activity(
+                currents, input_vector, planes, n_columns=self.crossbar.physical_columns
+            )
+            spikes = self.neurons.integrate(currents, dt)
+            self.local_spikes = spikes
+            outputs.append(np.array(spikes, dtype=int))
+
+        return outputs
+
+    def _plane_activity(self, inputs: np.ndarray):
+        """Active rows per DAC bit plane in bit-serial mode, else None."""
+        if self.crossbar.input_mode != "bit_serial":
+            return None
+        if inputs.ndim == 1:
+            return self.crossbar.bit_planes(inputs[None, :]).sum(axis=2)[0]
+        return self.crossbar.bit_planes(inputs).sum(axis=2)
+
     def update_device_state(self, time_elapsed: float):
-        """Update device drift and temporal effects."""
-        self.crossbar.update_drift(time_elapsed)
+        """
+        Update device drift and temporal effects. Goes through sync_to, so
+        the elapsed time is not applied again by a later sync.
+        """
+        self.sync_to(self.last_update_time + time_elapsed)
 
     def reset(self):
         """Reset tile state."""
@@ -83,43 +169,92 @@ class NeuraTile:
 class TilePowerMonitor:
     """Monitor power consumption per tile."""
 
-    def __init__(self):
+    def __init__(self, energy: DeviceEnergy = None):
+        """
+        Args:
+            energy: Device energy coefficients (crossbar MAC, write, verify)
+        """
+        self.energy = energy if energy is not None else DeviceEnergy()
         self.total_energy = 0.0
         self.dac_energy = 0.0
         self.adc_energy = 0.0
         self.crossbar_energy = 0.0
         self.neuron_energy = 0.0
         self.activity_count = 0
+        # Crossbar read cycles (one per active bit plane): latency proxy
+        self.read_cycles = 0
+        # Programming: cell pulses, latency (ns) and energy (pJ)
+        self.program_pulses = 0
+        self.program_latency_ns = 0.0
+        self.write_energy = 0.0
 
-    def add_activity(self, output_currents: np.ndarray, input_vector: np.ndarray):
+    def add_activity(self, output_currents: np.ndarray, input_vector: np.ndarray,
+                     plane_active_inputs: np.ndarray = None, n_columns: int = None):
         """
         Log activity for energy estimation.
         Coefficients calibrated to match published ReRAM crossbar measurements:
-          - DAC: ~2.5 pJ per active input conversion (8-bit R-2R DAC)
-          - ADC: ~4.0 pJ per output column read (8-bit SAR ADC)
-          - Crossbar: ~0.15 pJ per MAC operation (dominant consumer)
+          - DAC: ~2.5 pJ per active input conversion (8-bit R-2R DAC);
+            ~2.5/8 pJ per active row per plane for 1-bit bit-serial drivers
+          - ADC: ~4.0 pJ per output column read (8-bit SAR ADC), per plane
+          - Crossbar: energy.mac_pj per MAC operation (~0.15 pJ for ReRAM;
+            dominant consumer)
           - Neurons: ~0.02 pJ per LIF spike event (lightweight digital)
 
         Args:
             output_currents: Crossbar output currents
             input_vector: Input voltages
+            plane_active_inputs: Active rows per DAC bit plane (bit-serial mode)
+            n_columns: Physical crossbar columns read (defaults to len(output_currents))
         """
-        n_active_inputs = int(np.sum(np.abs(input_vector) > 0))
-        n_cols = len(output_currents)
+        # ADC and MAC costs scale with the physical columns actually built,
+        # including differential G- planes and weight slices
+        n_cols = len(output_currents) if n_columns is None else n_columns
         num_spikes = int(np.sum(output_currents > 0))
 
-        # DAC: per active input conversion
-        self.dac_energy += n_active_inputs * 2.5
-        # ADC: per output column read
-        self.adc_energy += n_cols * 4.0
+        if plane_active_inputs is None:
+            plane_active_inputs = np.array([np.sum(np.abs(input_vector) > 0)])
+            dac_energy_per_input = 2.5
+        else:
+            dac_energy_per_input = 2.5 / 8
+        n_active_planes = int(np.count_nonzero(plane_active_inputs))
+        n_plane_inputs = int(np.sum(plane_active_inputs))
+
+        # DAC: per active input conversion (per plane in bit-serial mode)
+        self.dac_energy += n_plane_inputs * dac_energy_per_input
+        # ADC: per output column read, skipping planes with no driven row
+        self.adc_energy += n_active_planes * n_cols * 4.0
         # Crossbar: per MAC operation (active_inputs × output_columns)
-        self.crossbar_energy += n_active_inputs * n_cols * 0.15
+        self.crossbar_energy += n_plane_inputs * n_cols * self.energy.mac_pj
         # Neurons: per spike event only (lightweight)
         self.neuron_energy += num_spikes * 0.02
 
         self.activity_count += 1
+        self.read_cycles += n_active_planes
+        self._update_total()
+
+    def add_programming(self, program_stats: dict):
+        """
+        Log a programming operation (see CrossbarArray.program_stats).
+          - Write: energy.write_pulse_pj per cell programming pulse
+          - Verify: energy.verify_read_pj per cell verify read
+          - Latency: ~100 ns pulse + ~20 ns verify per row step
+
+        Args:
+            program_stats: Pulse, verify-read and row-step counts
+        """
+        verify_ns = 20.0 if program_stats["verify_reads"] else 0.0
+        self.program_pulses += program_stats["pulses"]
+        self.program_latency_ns += program_stats["row_steps"] * (100.0 + verify_ns)
+        self.write_energy += (
+            program_stats["pulses"] * self.energy.write_pulse_pj
+            + program_stats["verify_reads"] * self.energy.verify_read_pj
+        )
+        self._update_total()
+
+    def _update_total(self):
         self.total_energy = (
             self.dac_energy + self.adc_energy + self.crossbar_energy + self.neuron_energy
+            + self.write_energy
         )
 
     def get_total_energy(self) -> float:
@@ -134,3 +269,9 @@ class TilePowerMonitor:
         self.crossbar_energy = 0.0
         self.neuron_energy = 0.0
         self.activity_count = 0
+        # Crossbar read cycles (one per active bit plane): latency proxy
+        self.read_cycles = 0
+        # Programming: cell pulses, latency (ns) and energy (pJ)
+        self.program_pulses = 0
+        self.program_latency_ns = 0.0
+        self.write_energy = 0.0
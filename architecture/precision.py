@@ -0,0 +1,79 @@
+"""
+Numerical precision policy for NeuraEdge.
+Storage dtype sets how large per-cell conductance, logical-weight, router
+and SRAM arrays are kept in memory; compute dtype sets what reads, noise and
+ADC math run in. For example float16 storage with float32 accumulation cuts
+a drifted crossbar from 28 to 10 bytes per cell (uint32 write counters are
+not affected by the policy).
+"""
+
+from dataclasses import dataclass
+from typing import Dict, Optional, Union
+import numpy as np
+
+PRECISIONS = ("float64", "float32", "float16")
+
+
+@dataclass(frozen=True)
+class PrecisionPolicy:
+    """Storage and compute dtypes shared by crossbars, neurons, router and memory."""
+
+    storage: str = "float64"
+    compute: str = "float64"
+
+    def __post_init__(self):
+        for dtype in (self.storage, self.compute):
+            if dtype not in PRECISIONS:
+                raise ValueError(f"Unknown precision: {dtype}")
+        if np.dtype(self.compute).itemsize < np.dtype(self.storage).itemsize:
+            raise ValueError(
+                f"Compute precision {self.compute} is narrower than storage {self.storage}"
+            )
+
+    @classmethod
+    def from_config(cls, precision: Union[None, str, Dict[str, str]]) -> "PrecisionPolicy":
+        """
+        Build a policy from a config value.
+
+        Args:
+            precision: None (float64), one dtype name for both, or
+                       {"storage": ..., "compute": ...}
+
+        Returns:
+            Precision policy
+        """
+        if precision is None:
+            return cls()
+        if isinstance(precision, str):
+            return cls(storage=precision, compute=precision)
+        storage = precision.get("storage", "float64")
+        return cls(storage=storage, compute=precision.get("compute", storage))
+
+    @property
+    def storage_dtype(self) -> np.dtype:
+        return np.dtype(self.storage)
+
+    @property
+    def compute_dtype(self) -> np.dtype:
+        return np.dtype(self.compute)
+
+    @property
+    def full_width_storage(self) -> bool:
+        """True when state is stored in float64 (no rounding on store)."""
+        return self.storage_dtype == np.float64
+
+    def store(self, values: np.ndarray) -> np.ndarray:
+        """Cast to the storage dtype (no copy if already stored)."""
+        return np.asarray(values).astype(self.storage_dtype, copy=False)
+
+    def load(self, values: np.ndarray) -> np.ndarray:
+        """Cast to the compute dtype (no copy if already there)."""
+        return np.asarray(values).astype(self.compute_dtype, copy=False)
+
+
+DEFAULT_PRECISION = PrecisionPolicy()
+
+
+def resolve_precision(precision: Optional[PrecisionPolicy]) -> PrecisionPolicy:
+    """Return precision, or the float64 default when it is None."""
+    return DEFAULT_PRECISION if precision is None else precision
@@ -1,29 +1,143 @@
 """
 Tile manager for multi-tile coordination.
+Tiles are materialized lazily on first use, so unprogrammed tiles cost
+no memory or startup time. Drift is likewise applied lazily: each tile is
+brought up to the current simulation time only when it is touched.
 """
 
 import numpy as np
-from typing import List
+from typing import Dict, Hashable, List, Tuple, Union
 from architecture.neuratile import NeuraTile
+from architecture.precision import PrecisionPolicy, resolve_precision
+from architecture.weight_slicing import WeightSlicer
 from device_layer.base_device import DeviceModel
+from device_layer.device_config import DeviceConfig, DeviceFactory
+from device_layer.random_streams import RandomStreams
 
 
 class TileManager:
     """Manages multiple NeuraTiles."""
 
-    def __init__(self, num_tiles: int, tile_size: int, device_model: DeviceModel):
+    def __init__(self, num_tiles: int, tile_size: Union[int, Tuple[int, int]],
+                 device_model: Union[DeviceModel, str],
+                 seed: int = None, drift_enabled: bool = True,
+                 weight_slicer: WeightSlicer = None, differential: bool = False,
+                 device_config: DeviceConfig = None, precision: PrecisionPolicy = None):
         """
         Args:
             num_tiles: Number of tiles
-            tile_size: Size of each tile (tile_size x tile_size)
-            device_model: Device model for all tiles
+            tile_size: Default tile shape: n for n x n, or (rows, cols) in logical
+                       weights (slicing and differential pairs add physical columns)
+            device_model: Device model for all tiles, or a registered device name
+            seed: Root seed; each tile gets its own stream derived from it
+            drift_enabled: Apply device drift as simulation time advances
+            weight_slicer: Optional bit-slicing of weights across columns
+            differential: Use G+/G- conductance pairs for signed weights
+            device_config: Device configuration (faults, read-noise pipeline, endurance)
+            precision: Storage/compute dtypes for every tile (None keeps float64)
         """
         self.num_tiles = num_tiles
         self.tile_size = tile_size
-        self.tiles = [
-            NeuraTile(tile_id=i, size=tile_size, device_model=device_model)
-            for i in range(num_tiles)
-        ]
+        self.tile_shape = (tile_size, tile_size) if np.isscalar(tile_size) else tuple(tile_size)
+        # Per-tile (rows, cols) overrides, e.g. sized to each layer's weights
+        self.tile_shapes: Dict[int, Tuple[int, int]] = {}
+        self.device_model = DeviceFactory.resolve(device_model)
+        self.streams = RandomStreams(seed)
+        self.drift_enabled = drift_enabled
+        self.weight_slicer = weight_slicer
+        self.differential = differential
+        self.device_config = device_config
+        self.precision = resolve_precision(precision)
+        # Global simulation time (ms)
+        self.sim_time = 0.0
+        # Resident (materialized) tiles, keyed by tile id
+        self.tiles: Dict[int, NeuraTile] = {}
+
+    def _materialize(self, tile_id: int) -> NeuraTile:
+        """Return tile, building it on first access."""
+        if not 0 <= tile_id < self.num_tiles:
+            raise ValueError(f"Tile {tile_id} out of range")
+        tile = self.tiles.get(tile_id)
+        if tile is None:
+            rows, cols = self.get_tile_shape(tile_id)
+            tile = NeuraTile(
+                tile_id=tile_id,
+                size=rows,
+                cols=cols,
+                device_model=self.device_model,
+                rng=self.streams.tile(tile_id),
+                weight_slicer=self.weight_slicer,
+                differential=self.differential,
+                precision=self.precision,
+            )
+            if self.device_config is not None:
+                # Fault maps are a fixed chip property, drawn from their own stream
+                fault_map = DeviceFactory.create_fault_map(
+                    self.device_config,
+                    tile.crossbar.conductances.shape,
+                    rng=self.streams.faults(tile_id),
+                )
+                if fault_map is not None:
+                    tile.crossbar.set_fault_map(fault_map)
+                # Device-to-device variation is fixed per chip: same seed, same map
+                variation_map = DeviceFactory.create_variation_map(
+                    self.device_config,
+                    tile.crossbar.conductances.shape,
+                    root_seed=self.streams.root_seed,
+                    tile_id=tile_id,
+                )
+                tile.crossbar.variation_map = variation_map
+                # Each tile gets its own pipeline so RTN cell states stay per tile
+                tile.crossbar.noise_pipeline = DeviceFactory.create_noise_pipeline(self.device_config)
+                tile.crossbar.endurance_model = DeviceFactory.create_endurance_model(self.device_config)
+                if self.device_config.write_verify:
+                    tile.crossbar.program_mode = "write_verify"
+                    tile.crossbar.verify_tolerance = self.device_config.verify_tolerance
+                    tile.crossbar.max_pulses = self.device_config.max_program_pulses
+                mlc = DeviceFactory.create_mlc_levels(self.device_config)
+                if mlc is not None:
+                    tile.crossbar.set_mlc_levels(mlc)
+            tile.drift_enabled = self.drift_enabled
+            tile.last_update_time = self.sim_time
+            self.tiles[tile_id] = tile
+        return tile
+
+    def set_tile_shape(self, tile_id: int, rows: int, cols: int):
+        """
+        Give one tile its own crossbar shape (before it is first used).
+
+        Args:
+            tile_id: Target tile
+            rows: Crossbar rows (layer inputs)
+            cols: Logical weight columns (layer outputs)
+        """
+        if tile_id in self.tiles:
+            raise ValueError(f"Tile {tile_id} is already resident; shape is fixed")
+        self.tile_shapes[tile_id] = (rows, cols)
+
+    def get_tile_shape(self, tile_id: int) -> Tuple[int, int]:
+        """Crossbar (rows, logical cols) of a tile."""
+        return self.tile_shapes.get(tile_id, self.tile_shape)
+
+    def get_weight_shape(self, tile_id: int) -> Tuple[int, int]:
+        """Logical weight-matrix shape a tile accepts (rows, outputs)."""
+        return self.get_tile_shape(tile_id)
+
+    def _touch(self, tile_id: int) -> NeuraTile:
+        """Materialize tile and apply any drift pending since its last touch."""
+        tile = self._materialize(tile_id)
+        tile.sync_to(self.sim_time)
+        return tile
+
+    def advance_time(self, time_elapsed: float):
+        """
+        Advance global simulation time. Idle tiles are not touched; their
+        drift is applied in bulk the next time they are read or programmed.
+
+        Args:
+            time_elapsed: Simulated time (ms)
+        """
+        self.sim_time += time_elapsed
 
     def program_tile(self, tile_id: int, weights: np.ndarray):
         """
@@ -33,13 +147,52 @@ class TileManager:
             tile_id: Target tile
             weights: Weight matrix
         """
-        if tile_id >= self.num_tiles:
-            raise ValueError(f"Tile {tile_id} out of range")
-        self.tiles[tile_id].program_weights(weights)
+        tile = self._materialize(tile_id)
+        tile.program_weights(weights)
+        # Fresh programming restarts drift, so nothing is pending
+        tile.last_update_time = self.sim_time
+
+    def program_tile_region(self, tile_id: int, weights: np.ndarray, row_start: int, col_start: int):
+        """
+        Reprogram a block of a tile's weights; only that block is written.
+
+        Args:
+            tile_id: Target tile
+            weights: Weight block
+            row_start: First crossbar row
+            col_start: First logical column
+        """
+        # Bring unwritten cells up to date before the drift clock restarts
+        tile = self._touch(tile_id)
+        tile.program_region(weights, row_start, col_start)
+
+    def get_tile_wear(self) -> np.ndarray:
+        """Peak per-cell write count of every tile (0 for non-resident tiles)."""
+        wear = np.zeros(self.num_tiles, dtype=np.int64)
+        for tile_id, tile in self.tiles.items():
+            wear[tile_id] = tile.crossbar.write_counts.max()
+        return wear
+
+    def assign_layers_by_wear(self, write_rates: Dict[Hashable, float]) -> Dict[Hashable, int]:
+        """
+        Wear-aware mapping: the most frequently reprogrammed layers go to
+        the least-worn tiles.
+
+        Args:
+            write_rates: Expected reprogramming rate per layer
+
+        Returns:
+            Tile id per layer
+        """
+        if len(write_rates) > self.num_tiles:
+            raise ValueError(f"{len(write_rates)} layers do not fit on {self.num_tiles} tiles")
+        layers = sorted(write_rates, key=write_rates.get, reverse=True)
+        tiles = np.argsort(self.get_tile_wear(), kind="stable")
+        return {layer: int(tile_id) for layer, tile_id in zip(layers, tiles)}
 
     def execute(self, tile_id: int, inputs: np.ndarray, dt: float = 1.0) -> np.ndarray:
         """
-        Execute computation on tile.
+        Execute one time step on tile; simulation time advances by dt.
 
         Args:
             tile_id: Target tile
@@ -49,21 +202,83 @@ class TileManager:
         Returns:
             Spike output
         """
-        return self.tiles[tile_id].execute_layer(inputs, dt)
+        spikes = self._touch(tile_id).execute_layer(inputs, dt)
+        self.advance_time(dt)
+        return spikes
+
+    def execute_parallel(self, tile_inputs: Dict[int, np.ndarray], dt: float = 1.0) -> Dict[int, np.ndarray]:
+        """
+        Execute one time step on several tiles at the same simulation time;
+        simulation time advances by dt once, not once per tile.
+
+        Args:
+            tile_inputs: Input vector per tile id
+            dt: Time step
+
+        Returns:
+            Spike output per tile id
+        """
+        outputs = {
+            tile_id: self._touch(tile_id).execute_layer(inputs, dt)
+            for tile_id, inputs in tile_inputs.items()
+        }
+        self.advance_time(dt)
+        return outputs
+
+    def execute_batch(self, tile_id: int, inputs: np.ndarray, dt: float = 1.0) -> List[np.ndarray]:
+        """
+        Execute a whole input train on tile with a single crossbar read;
+        simulation time advances by dt per time step.
+
+        Args:
+            tile_id: Target tile
+            inputs: Input train (timesteps, size)
+            dt: Time step
+
+        Returns:
+            Spike output per time step
+        """
+        outputs = self._touch(tile_id).execute_layer_batch(inputs, dt)
+        self.advance_time(dt * len(inputs))
+        return outputs
 
     def get_tile(self, tile_id: int) -> NeuraTile:
-        """Get tile by ID."""
-        return self.tiles[tile_id]
+        """Get tile by ID (materializes it and applies pending drift if needed)."""
+        return self._touch(tile_id)
+
+    def is_resident(self, tile_id: int) -> bool:
+        """Check whether a tile has been materialized."""
+        return tile_id in self.tiles
+
+    def get_resident_count(self) -> int:
+        """Return number of materialized tiles."""
+        return len(self.tiles)
 
     def reset_all(self):
         """Reset all tiles."""
-        for tile in self.tiles:
+        for tile in self.tiles.values():
             tile.reset()
 
     def get_power_summary(self) -> dict:
-        """Get power consumption across all tiles."""
-        total_energy = sum(tile.power_monitor.get_total_energy() for tile in self.tiles)
+        """Get power consumption across all tiles (non-resident tiles consume nothing)."""
+        per_tile = [
+            self.tiles[i].power_monitor.get_total_energy() if i in self.tiles else 0.0
+            for i in range(self.num_tiles)
+        ]
+        return {
+            "total_energy": sum(per_tile),
+            "per_tile": per_tile,
+            "resident_tiles": self.get_resident_count(),
+        }
+
+    def get_programming_summary(self) -> dict:
+        """Programming pulses, latency (ns) and write energy (pJ) per tile."""
+        monitors = [
+            self.tiles[i].power_monitor if i in self.tiles else None
+            for i in range(self.num_tiles)
+        ]
         return {
-            "total_energy": total_energy,
-            "per_tile": [tile.power_monitor.get_total_energy() for tile in self.tiles],
+            "pulses": [m.program_pulses if m else 0 for m in monitors],
+            "latency_ns": [m.program_latency_ns if m else 0.0 for m in monitors],
+            "write_energy": [m.write_energy if m else 0.0 for m in monitors],
         }
@@ -0,0 +1,90 @@
+"""
+Bit-sliced weight mapping for NeuraEdge crossbars.
+A high-precision weight is split into k low-precision slices stored on
+adjacent physical columns; slice outputs are recombined by shift-add
+after the ADC.
+"""
+
+import numpy as np
+
+
+class WeightSlicer:
+    """Maps weights of weight_bits precision onto cells of bits_per_cell."""
+
+    def __init__(self, weight_bits: int, bits_per_cell: int):
+        """
+        Args:
+            weight_bits: Total weight precision
+            bits_per_cell: Precision one memristor can hold
+        """
+        self.weight_bits = weight_bits
+        self.bits_per_cell = bits_per_cell
+        self.num_slices = -(-weight_bits // bits_per_cell)
+        cell_levels = (1 << bits_per_cell) - 1
+        # Contribution of each slice (LSB first) to the normalized weight
+        self.place_values = (
+            (1 << (bits_per_cell * np.arange(self.num_slices))) * cell_levels
+            / ((1 << weight_bits) - 1)
+        )
+
+    @property
+    def max_code(self) -> int:
+        """Integer code of a full-scale weight."""
+        return (1 << self.weight_bits) - 1
+
+    def quantize(self, normalized_weights: np.ndarray) -> np.ndarray:
+        """
+        Integer codes (0 .. max_code) of weights in [0, 1].
+
+        Args:
+            normalized_weights: Weights scaled to [0, 1]
+
+        Returns:
+            int64 weight codes (same shape)
+        """
+        return np.round(np.clip(normalized_weights, 0, 1) * self.max_code).astype(np.int64)
+
+    def slice_weights(self, normalized_weights: np.ndarray) -> np.ndarray:
+        """
+        Quantize weights in [0, 1] and split them into slices.
+        Slices of logical column j occupy physical columns j*k .. j*k + k-1.
+
+        Args:
+            normalized_weights: Weights scaled to [0, 1] (rows, logical_cols)
+
+        Returns:
+            Per-cell normalized conductance targets (rows, logical_cols * k)
+        """
+        return self.slice_codes(self.quantize(normalized_weights))
+
+    def slice_codes(self, codes: np.ndarray) -> np.ndarray:
+        """
+        Split integer weight codes into slices (see slice_weights).
+
+        Args:
+            codes: Weight codes in 0 .. max_code (rows, logical_cols)
+
+        Returns:
+            Per-cell normalized conductance targets (rows, logical_cols * k)
+        """
+        rows, cols = codes.shape
+        cell_levels = (1 << self.bits_per_cell) - 1
+        shifts = self.bits_per_cell * np.arange(self.num_slices)
+        slices = (codes[:, :, None].astype(np.int64) >> shifts) & cell_levels
+        return slices.reshape(rows, cols * self.num_slices) / cell_levels
+
+    def combine(self, physical_outputs: np.ndarray, logical_cols: int) -> np.ndarray:
+        """
+        Shift-add slice outputs back into logical column outputs.
+        One reshape (a strided view) and one contraction over the slice axis.
+
+        Args:
+            physical_outputs: Column outputs (..., physical_cols)
+            logical_cols: Number of logical columns
+
+        Returns:
+            Logical column outputs (..., logical_cols)
+        """
+        used = physical_outputs[..., : logical_cols * self.num_slices]
+        grouped = used.reshape(used.shape[:-1] + (logical_cols, self.num_slices))
+        return grouped @ self.place_values
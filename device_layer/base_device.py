@@ -1,17 +1,61 @@
 """
 Base device model abstraction for NeuraEdge IP.
 All physical devices (ReRAM, PCM, SRAM) inherit from DeviceModel.
+
+Besides the scalar single-cell interface, models provide array
+counterparts that operate on whole conductance/voltage ndarrays, which is
+what the crossbar and Monte Carlo workloads use. Models that implement
+only the scalar methods get slow np.vectorize fallbacks for the arrays.
 """
 
+import copy
 from abc import ABC, abstractmethod
+from dataclasses import dataclass
 import numpy as np
+from device_layer.random_streams import resolve_rng
+
+
+@dataclass(frozen=True)
+class DeviceEnergy:
+    """Per-operation energy coefficients of a device technology (pJ)."""
+
+    mac_pj: float = 0.15
+    write_pulse_pj: float = 5.0
+    verify_read_pj: float = 0.15
 
 
 class DeviceModel(ABC):
     """Abstract base class for physical device models."""
 
-    def __init__(self, name: str):
+    # Array kernels; a model overriding all of them has no scalar fallback
+    BATCH_KERNELS = ("program_array", "read_array", "drift_array", "noise_array")
+    energy = DeviceEnergy()
+
+    def __init__(self, name: str, rng: np.random.Generator = None):
         self.name = name
+        # Default generator for scalar methods; None uses the global np.random state
+        self.rng = rng
+
+    def _rng(self, rng: np.random.Generator = None):
+        """Resolve the generator for a call: explicit rng, then self.rng, then global."""
+        return resolve_rng(rng if rng is not None else self.rng)
+
+    @classmethod
+    def has_batch_kernels(cls) -> bool:
+        """True if the model implements every array kernel itself."""
+        return all(getattr(cls, name) is not getattr(DeviceModel, name) for name in cls.BATCH_KERNELS)
+
+    def _scalar_fallback(self, cell_fn, *arrays, rng: np.random.Generator = None) -> np.ndarray:
+        """
+        Apply a per-cell function built on the scalar methods over arrays.
+        cell_fn(device, *values) runs on a private shallow copy of the
+        model, so fallback array calls neither disturb the single-cell
+        interface nor race other threads sharing this model (e.g. tiles).
+        """
+        device = copy.copy(self)
+        if rng is not None:
+            device.rng = rng
+        return np.vectorize(lambda *values: cell_fn(device, *values), otypes=[float])(*arrays)
 
     @abstractmethod
     def program(self, conductance: float) -> float:
@@ -44,3 +88,89 @@ class DeviceModel(ABC):
     def inject_noise(self) -> float:
         """Return noise contribution to current."""
         pass
+
+    def program_array(self, conductance: np.ndarray, rng: np.random.Generator = None) -> np.ndarray:
+        """
+        Program an array of cells to target conductances.
+        The default loops program() over the cells (slow fallback).
+        Args:
+            conductance: Target conductance array
+            rng: Generator for programming variation
+        Returns:
+            Actual programmed conductances (same shape)
+        """
+        return self._scalar_fallback(lambda device, g: device.program(g), conductance, rng=rng)
+
+    def read_array(self, conductance: np.ndarray, voltage: np.ndarray) -> np.ndarray:
+        """
+        Elementwise read current for cells at the given voltages.
+        The default loops read() over the cells (slow fallback).
+        Args:
+            conductance: Cell conductance array
+            voltage: Applied voltages (broadcastable against conductance)
+        Returns:
+            Read current per cell
+        """
+        def read_cell(device, g, v):
+            device.current_conductance = g
+            return device.read(v)
+        return self._scalar_fallback(read_cell, conductance, voltage)
+
+    def drift_array(self, conductance: np.ndarray, time_elapsed: float) -> np.ndarray:
+        """
+        Conductance of cells time_elapsed after programming (closed form,
+        so the cost is the same for 1 ms as for 10 years).
+        The default replays update_drift() per cell (slow fallback).
+        Args:
+            conductance: As-programmed cell conductance array
+            time_elapsed: Time since programming (ms)
+        Returns:
+            Conductances after drift
+        """
+        def drift_cell(device, g):
+            device.current_conductance = device.programmed_conductance = g
+            device.drift_age = 0.0
+            device.update_drift(time_elapsed)
+            return device.current_conductance
+        return self._scalar_fallback(drift_cell, conductance)
+
+    def noise_array(self, conductance: np.ndarray, rng: np.random.Generator = None) -> np.ndarray:
+        """
+        Sample read-noise current contribution for every cell.
+        The default loops inject_noise() over the cells (slow fallback).
+        Args:
+            conductance: Cell conductance array
+            rng: Generator for noise samples
+        Returns:
+            Noise current per cell (same shape)
+        """
+        def noise_cell(device, g):
+            device.current_conductance = g
+            return device.inject_noise()
+        return self._scalar_fallback(noise_cell, conductance, rng=rng)
+
+    def noise_moments(self, conductance: np.ndarray):
+        """
+        Per-cell mean and variance of the read-noise distribution.
+        Used to sample one aggregated noise value per crossbar column.
+
+        Args:
+            conductance: Cell conductance array
+        Returns:
+            (mean, variance) arrays, same shape as conductance
+        """
+        raise NotImplementedError(f"{self.name} does not expose noise moments")
+
+    def read_columns(self, conductance: np.ndarray, voltages: np.ndarray) -> np.ndarray:
+        """
+        Column currents of a crossbar: sum_i I(G_ij, V_i).
+        Models whose current separates as f(V) * G override this with a
+        matrix product; the default sums read_array over the input rows.
+
+        Args:
+            conductance: Crossbar conductances (rows, cols)
+            voltages: Row voltages (rows,) or (batch, rows)
+        Returns:
+            Column currents (cols,) or (batch, cols)
+        """
+        return self.read_array(conductance, voltages[..., :, None]).sum(axis=-2)
@@ -1,20 +1,36 @@
 """
 Device configuration and factory for NeuraEdge IP.
+
+Device technologies are looked up in a registry. Built-in models are
+registered below; plugins register with DeviceFactory.register (or the
+register_device decorator) or through the "neuraedge.devices" entry-point
+group, declaring their constructor parameters and energy coefficients.
 """
 
-from dataclasses import dataclass
-from typing import Literal
-from device_layer.base_device import DeviceModel
+import warnings
+from dataclasses import dataclass, field
+from importlib.metadata import entry_points
+from typing import Any, Dict, List, Literal, Optional, Sequence, Tuple, Type, Union
+import numpy as np
+from device_layer.base_device import DeviceEnergy, DeviceModel
+from device_layer.drift_models import EnduranceDegradation
+from device_layer.lut_model import LUTDeviceModel
+from device_layer.mlc_levels import MLCLevels
+from device_layer.noise_models import (
+    GaussianNoise, LogNormalNoise, NoisePipeline, RandomTelegraphNoise, StuckAtFaultMap
+)
 from device_layer.reram_model import ReRAMModel
 from device_layer.pcm_model import PCMModel
 from device_layer.sram_fallback import SRAMFallbackModel
+from device_layer.variation_maps import DeviceVariationMap, load_variation_map
 
 
 @dataclass
 class DeviceConfig:
     """Device configuration parameters."""
 
-    device_type: Literal["reram", "pcm", "sram"] = "reram"
+    # Registered device name (built in: "reram", "pcm", "sram")
+    device_type: str = "reram"
     max_conductance: float = 1e-4
     min_conductance: float = 1e-6
     noise_level: float = 0.02
@@ -22,28 +38,239 @@ class DeviceConfig:
     temperature_celsius: float = 25.0
     enable_stuck_at_faults: bool = False
     fault_rate: float = 0.001
+    fault_pattern: Literal["random", "row", "column", "clustered"] = "random"
+    stuck_max_fraction: float = 0.5
+    bits_per_cell: int = 8
+    # "device" uses the device model's own read noise; "pipeline" replaces it
+    # with the stacked stages below (see DeviceFactory.create_noise_pipeline)
+    read_noise: Literal["device", "pipeline"] = "device"
+    lognormal_sigma: float = 0.0
+    rtn_amplitude: float = 0.0
+    rtn_flip_probability: float = 0.0
+    # Write endurance; None disables wear degradation (writes are still counted)
+    endurance_cycles: Optional[float] = None
+    endurance_window_shrink: float = 0.5
+    endurance_variability_growth: float = 2.0
+    # Program-and-verify: re-pulse cells until within verify_tolerance * max_conductance
+    write_verify: bool = False
+    verify_tolerance: float = 0.01
+    max_program_pulses: int = 20
+    # Serve reads from a tabulated I-V curve (optionally persisted to a cache dir)
+    iv_table: bool = False
+    iv_table_cache_dir: Optional[str] = None
+    # Multi-level cells: None stores continuous conductances; otherwise cells
+    # hold one of mlc_levels levels, each with relative std mlc_level_sigma
+    mlc_levels: Optional[int] = None
+    mlc_spacing: Literal["linear", "log"] = "linear"
+    mlc_level_sigma: Union[float, Sequence[float]] = 0.0
+    # Device-to-device variation: fixed per-cell programming gain/offset
+    # drawn once from the chip seed (0 disables); optionally persisted
+    d2d_gain_sigma: float = 0.0
+    d2d_offset_sigma: float = 0.0
+    variation_cache_dir: Optional[str] = None
+    # Extra constructor parameters for plugin devices (override fields above)
+    device_params: Dict[str, Any] = field(default_factory=dict)
+
+
+@dataclass
+class DeviceSpec:
+    """Registered device technology."""
+
+    name: str
+    model_class: Type[DeviceModel]
+    # Constructor keywords, read from DeviceConfig.device_params or DeviceConfig fields
+    parameters: Tuple[str, ...] = ("max_conductance", "min_conductance")
+    energy: Optional[DeviceEnergy] = None
+
+
+ENTRY_POINT_GROUP = "neuraedge.devices"
+_REGISTRY: Dict[str, DeviceSpec] = {}
 
 
 class DeviceFactory:
     """Factory for creating device models."""
 
+    _entry_points_loaded = False
+
+    @staticmethod
+    def register(name: str, model_class: Type[DeviceModel],
+                 parameters: Tuple[str, ...] = ("max_conductance", "min_conductance"),
+                 energy: DeviceEnergy = None) -> DeviceSpec:
+        """
+        Register a device technology under a name.
+
+        Args:
+            name: Device type used in configs (e.g. "fefet")
+            model_class: DeviceModel subclass
+            parameters: Constructor keywords to fill from the config
+            energy: Energy coefficients (defaults to model_class.energy)
+
+        Returns:
+            The registered spec
+        """
+        if not model_class.has_batch_kernels():
+            warnings.warn(
+                f"Device '{name}' ({model_class.__name__}) does not implement all of "
+                f"{', '.join(DeviceModel.BATCH_KERNELS)}; missing kernels fall back to "
+                "np.vectorize over its scalar methods, which is orders of magnitude slower",
+                RuntimeWarning,
+                stacklevel=2,
+            )
+        spec = DeviceSpec(name, model_class, tuple(parameters), energy)
+        _REGISTRY[name] = spec
+        return spec
+
+    @staticmethod
+    def unregister(name: str):
+        """Remove a registered device technology."""
+        _REGISTRY.pop(name, None)
+
+    @staticmethod
+    def get_spec(name: str) -> DeviceSpec:
+        """Look up a device, loading entry-point plugins on the first miss."""
+        if name not in _REGISTRY and not DeviceFactory._entry_points_loaded:
+            DeviceFactory._load_entry_points()
+        if name not in _REGISTRY:
+            raise ValueError(f"Unknown device type: {name}")
+        return _REGISTRY[name]
+
+    @staticmethod
+    def available() -> List[str]:
+        """Names of all registered device technologies."""
+        if not DeviceFactory._entry_points_loaded:
+            DeviceFactory._load_entry_points()
+        return sorted(_REGISTRY)
+
+    @staticmethod
+    def _load_entry_points():
+        """Register plugins from the entry-point group (a DeviceSpec or a model class each)."""
+        DeviceFactory._entry_points_loaded = True
+        eps = entry_points()
+        if hasattr(eps, "select"):
+            group = eps.select(group=ENTRY_POINT_GROUP)
+        else:  # Python < 3.10
+            group = eps.get(ENTRY_POINT_GROUP, [])
+        for ep in group:
+            plugin = ep.load()
+            if isinstance(plugin, DeviceSpec):
+                _REGISTRY.setdefault(plugin.name, plugin)
+            elif ep.name not in _REGISTRY:
+                DeviceFactory.register(ep.name, plugin)
+
     @staticmethod
     def create(config: DeviceConfig) -> DeviceModel:
         """Create device model based on config."""
-        if config.device_type == "reram":
-            return ReRAMModel(
-                max_conductance=config.max_conductance,
-                min_conductance=config.min_conductance
-            )
-        elif config.device_type == "pcm":
-            return PCMModel(
-                max_conductance=config.max_conductance,
-                min_conductance=config.min_conductance
-            )
-        elif config.device_type == "sram":
-            return SRAMFallbackModel(
-                max_conductance=config.max_conductance,
-                min_conductance=config.min_conductance
-            )
-        else:
-            raise ValueError(f"Unknown device type: {config.device_type}")
+        device = DeviceFactory._create_physical(config)
+        if config.iv_table:
+            return LUTDeviceModel(device, cache_dir=config.iv_table_cache_dir)
+        return device
+
+    @staticmethod
+    def resolve(device: Union[DeviceModel, str]) -> DeviceModel:
+        """Return a device model instance, creating one by registry name if needed."""
+        if isinstance(device, str):
+            return DeviceFactory.create(DeviceConfig(device_type=device))
+        return device
+
+    @staticmethod
+    def _create_physical(config: DeviceConfig) -> DeviceModel:
+        """Create the physical device model named by config.device_type."""
+        spec = DeviceFactory.get_spec(config.device_type)
+        kwargs = {}
+        for param in spec.parameters:
+            if param in config.device_params:
+                kwargs[param] = config.device_params[param]
+            elif hasattr(config, param):
+                kwargs[param] = getattr(config, param)
+        device = spec.model_class(**kwargs)
+        if spec.energy is not None:
+            device.energy = spec.energy
+        return device
+
+    @staticmethod
+    def create_fault_map(config: DeviceConfig, shape: Tuple[int, ...],
+                         rng: np.random.Generator = None) -> Optional[StuckAtFaultMap]:
+        """Create a stuck-at fault map for a crossbar, or None if faults are disabled."""
+        if not config.enable_stuck_at_faults or config.fault_rate <= 0:
+            return None
+        return StuckAtFaultMap(
+            shape,
+            fault_rate=config.fault_rate,
+            g_min=config.min_conductance,
+            g_max=config.max_conductance,
+            pattern=config.fault_pattern,
+            stuck_max_fraction=config.stuck_max_fraction,
+            rng=rng,
+        )
+
+    @staticmethod
+    def create_variation_map(config: DeviceConfig, shape: Tuple[int, ...], root_seed: int,
+                             tile_id: int) -> Optional[DeviceVariationMap]:
+        """Return a tile's cached device-to-device variation map, or None if disabled."""
+        if config.d2d_gain_sigma <= 0 and config.d2d_offset_sigma <= 0:
+            return None
+        return load_variation_map(
+            root_seed,
+            tile_id,
+            shape,
+            gain_sigma=config.d2d_gain_sigma,
+            offset_sigma=config.d2d_offset_sigma,
+            g_max=config.max_conductance,
+            cache_dir=config.variation_cache_dir,
+        )
+
+    @staticmethod
+    def create_noise_pipeline(config: DeviceConfig) -> Optional[NoisePipeline]:
+        """
+        Create the read-noise pipeline for one crossbar, or None when the
+        device model's own noise is used. Stages: relative Gaussian
+        (noise_level), log-normal (lognormal_sigma), then per-cell RTN.
+        """
+        if config.read_noise != "pipeline":
+            return None
+        pipeline = NoisePipeline()
+        if config.noise_level > 0:
+            pipeline.add(GaussianNoise(config.noise_level, relative=True))
+        if config.lognormal_sigma > 0:
+            pipeline.add(LogNormalNoise(config.lognormal_sigma))
+        if config.rtn_amplitude > 0:
+            pipeline.add(RandomTelegraphNoise(config.rtn_amplitude, config.rtn_flip_probability))
+        return pipeline
+
+    @staticmethod
+    def create_endurance_model(config: DeviceConfig) -> Optional[EnduranceDegradation]:
+        """Create the write-wear model, or None if endurance is not modeled."""
+        if config.endurance_cycles is None:
+            return None
+        return EnduranceDegradation(
+            endurance_cycles=config.endurance_cycles,
+            window_shrink=config.endurance_window_shrink,
+            variability_growth=config.endurance_variability_growth,
+        )
+
+    @staticmethod
+    def create_mlc_levels(config: DeviceConfig) -> Optional[MLCLevels]:
+        """Create the MLC level table, or None for continuous conductances."""
+        if config.mlc_levels is None:
+            return None
+        return MLCLevels(
+            config.mlc_levels,
+            g_min=config.min_conductance,
+            g_max=config.max_conductance,
+            spacing=config.mlc_spacing,
+            level_sigma=config.mlc_level_sigma,
+        )
+
+
+def register_device(name: str, parameters: Tuple[str, ...] = ("max_conductance", "min_conductance"),
+                    energy: DeviceEnergy = None):
+    """Class decorator form of DeviceFactory.register."""
+    def decorator(model_class: Type[DeviceModel]) -> Type[DeviceModel]:
+        DeviceFactory.register(name, model_class, parameters, energy)
+        return model_class
+    return decorator
+
+
+DeviceFactory.register("reram", ReRAMModel)
+DeviceFactory.register("pcm", PCMModel)
+DeviceFactory.register("sram", SRAMFallbackModel)
@@ -21,6 +21,34 @@ class ConductanceDrift:
         self.accumulated_drift += drift
         return -drift
 
+    def conductance_at(self, initial_conductance, time_elapsed):
+        """
+        Closed form of repeated update() calls: G(t) = G0 * exp(-k * t / 1000).
+        Vectorized over conductance arrays; cost is independent of time_elapsed.
+        """
+        return initial_conductance * np.exp(-self.drift_coefficient * (time_elapsed / 1000))
+
+
+class PowerLawDrift:
+    """Power-law conductance drift G(t) = G0 * (t / t0)^-nu (PCM, ReRAM retention)."""
+
+    def __init__(self, nu: float, t0: float = 1000.0):
+        """
+        Args:
+            nu: Drift exponent
+            t0: Reference time after programming (ms); no drift before t0
+        """
+        self.nu = nu
+        self.t0 = t0
+
+    def conductance_at(self, initial_conductance, time_elapsed):
+        """
+        Conductance time_elapsed (ms) after programming, in closed form.
+        Vectorized over conductance arrays; cost is independent of time_elapsed.
+        """
+        t = np.maximum(time_elapsed, self.t0)
+        return initial_conductance * (t / self.t0) ** (-self.nu)
+
 
 class TemperatureDrift:
     """Temperature-dependent drift (PCM more sensitive)."""
@@ -47,3 +75,56 @@ class MultiLevelCellDegradation:
     def get_degradation_factor(self) -> float:
         """Return conductance degradation factor (multiplier < 1)."""
         return 1.0 - (self.degradation_rate * self.cycle_count)
+
+
+class EnduranceDegradation:
+    """
+    Write-endurance wear, vectorized over per-cell write counts.
+    As a cell approaches its endurance limit its usable conductance window
+    shrinks toward mid-range and its programming error grows.
+    """
+
+    def __init__(self, endurance_cycles: float = 1e6, window_shrink: float = 0.5,
+                 variability_growth: float = 2.0):
+        """
+        Args:
+            endurance_cycles: Writes a cell survives before wear-out
+            window_shrink: Fraction of the conductance window lost at wear-out
+            variability_growth: Extra programming error (x nominal) at wear-out
+        """
+        self.endurance_cycles = endurance_cycles
+        self.window_shrink = window_shrink
+        self.variability_growth = variability_growth
+
+    def wear(self, write_counts: np.ndarray) -> np.ndarray:
+        """Fraction of endurance consumed per cell (may exceed 1)."""
+        return write_counts / self.endurance_cycles
+
+    def cycles_remaining(self, write_counts: np.ndarray) -> np.ndarray:
+        """Writes left per cell before wear-out."""
+        # Signed difference: unsigned counts past the limit would wrap around
+        return np.maximum(self.endurance_cycles - write_counts.astype(np.int64), 0)
+
+    def conductance_window(self, write_counts: np.ndarray, g_min: float, g_max: float):
+        """Per-cell (low, high) conductance bounds after wear."""
+        loss = 0.5 * self.window_shrink * np.minimum(self.wear(write_counts), 1.0) * (g_max - g_min)
+        return g_min + loss, g_max - loss
+
+    def apply(self, programmed: np.ndarray, targets: np.ndarray, write_counts: np.ndarray,
+              g_min: float, g_max: float) -> np.ndarray:
+        """
+        Degrade freshly programmed conductances by each cell's wear.
+
+        Args:
+            programmed: Conductances from the device's nominal programming
+            targets: Programming targets, already within [g_min, g_max]
+            write_counts: Writes per cell, including this one
+            g_min: Device minimum conductance
+            g_max: Device maximum conductance
+
+        Returns:
+            Worn conductances (same shape)
+        """
+        scale = 1.0 + self.variability_growth * np.minimum(self.wear(write_counts), 1.0)
+        low, high = self.conductance_window(write_counts, g_min, g_max)
+        return np.clip(targets + (programmed - targets) * scale, low, high)
@@ -0,0 +1,159 @@
+"""
+Lookup-table I-V device model for NeuraEdge.
+Replaces a device's read physics with a precomputed (conductance x voltage)
+current table and bilinear interpolation, so reads cost a few array
+operations however expensive the source model is. Programming, drift and
+noise are delegated to the source model.
+"""
+
+import hashlib
+import json
+import os
+from typing import Optional, Tuple
+import numpy as np
+from device_layer.base_device import DeviceModel
+
+# Per-cell state that does not change a model's I-V characteristic
+_STATE_ATTRIBUTES = {"name", "current_conductance", "programmed_conductance", "drift_age"}
+
+
+def model_parameters(model: DeviceModel) -> dict:
+    """Scalar parameters of a device model, excluding per-cell state."""
+    params = {
+        key: value for key, value in vars(model).items()
+        if isinstance(value, (bool, int, float, str)) and key not in _STATE_ATTRIBUTES
+    }
+    params["model"] = f"{type(model).__module__}.{type(model).__qualname__}"
+    return params
+
+
+def build_iv_table(model: DeviceModel, g_grid: np.ndarray, v_grid: np.ndarray) -> np.ndarray:
+    """
+    Tabulate a model's read current on a (conductance x voltage) grid.
+    Uses the model's read_array, so any DeviceModel subclass works.
+
+    Args:
+        model: Source device model
+        g_grid: Conductance grid points (n_g,)
+        v_grid: Voltage grid points (n_v,)
+
+    Returns:
+        Current table (n_g, n_v)
+    """
+    return np.asarray(model.read_array(g_grid[:, None], v_grid[None, :]), dtype=float)
+
+
+class LUTDeviceModel(DeviceModel):
+    """Device model whose I-V curve is a bilinearly interpolated table."""
+
+    def __init__(self, source: DeviceModel, g_points: int = 65, v_points: int = 65,
+                 v_range: Tuple[float, float] = (0.0, 1.0), cache_dir: Optional[str] = None):
+        """
+        Args:
+            source: Model the table is generated from (and delegated to)
+            g_points: Grid points over [min_conductance, max_conductance]
+            v_points: Grid points over v_range
+            v_range: Tabulated voltage range; reads outside it extrapolate linearly
+            cache_dir: Directory for persisted tables (None keeps them in memory)
+        """
+        super().__init__(f"LUT[{source.name}]", source.rng)
+        self.source = source
+        self.g_grid = np.linspace(source.min_conductance, source.max_conductance, g_points)
+        self.v_grid = np.linspace(v_range[0], v_range[1], v_points)
+        self.cache_dir = cache_dir
+        self.table = self._load_or_build()
+
+    @property
+    def max_conductance(self) -> float:
+        return self.source.max_conductance
+
+    @property
+    def min_conductance(self) -> float:
+        return self.source.min_conductance
+
+    @property
+    def current_conductance(self) -> float:
+        return self.source.current_conductance
+
+    @property
+    def drift_coefficient(self) -> float:
+        return self.source.drift_coefficient
+
+    @property
+    def energy(self):
+        return self.source.energy
+
+    def cache_key(self) -> str:
+        """Hash of the source model's parameters and the table grids."""
+        spec = model_parameters(self.source)
+        spec["g_grid"] = [self.g_grid[0], self.g_grid[-1], len(self.g_grid)]
+        spec["v_grid"] = [self.v_grid[0], self.v_grid[-1], len(self.v_grid)]
+        return hashlib.sha256(json.dumps(spec, sort_keys=True).encode()).hexdigest()[:16]
+
+    def _load_or_build(self) -> np.ndarray:
+        """Load the table from cache_dir, or build it (and persist it)."""
+        if self.cache_dir is None:
+            return build_iv_table(self.source, self.g_grid, self.v_grid)
+
+        path = os.path.join(self.cache_dir, f"iv_{self.cache_key()}.npy")
+        if os.path.exists(path):
+            return np.load(path)
+        table = build_iv_table(self.source, self.g_grid, self.v_grid)
+        os.makedirs(self.cache_dir, exist_ok=True)
+        np.save(path, table)
+        return table
+
+    def interpolate(self, conductance: np.ndarray, voltage: np.ndarray) -> np.ndarray:
+        """
+        Bilinear interpolation of the table on uniform grids.
+        Both axes locate their cell by arithmetic (no search), and the four
+        corner currents are blended in one expression.
+
+        Args:
+            conductance: Cell conductances
+            voltage: Applied voltages (broadcastable against conductance)
+
+        Returns:
+            Interpolated currents (broadcast shape)
+        """
+        g_pos = (np.asarray(conductance) - self.g_grid[0]) / (self.g_grid[1] - self.g_grid[0])
+        v_pos = (np.asarray(voltage) - self.v_grid[0]) / (self.v_grid[1] - self.v_grid[0])
+        i = np.clip(np.floor(g_pos).astype(np.intp), 0, len(self.g_grid) - 2)
+        j = np.clip(np.floor(v_pos).astype(np.intp), 0, len(self.v_grid) - 2)
+        # Fractions are not clipped, so points off the grid extrapolate linearly
+        t = g_pos - i
+        u = v_pos - j
+        table = self.table
+        return (
+            (1 - t) * ((1 - u) * table[i, j] + u * table[i, j + 1])
+            + t * ((1 - u) * table[i + 1, j] + u * table[i + 1, j + 1])
+        )
+
+    def program(self, conductance: float) -> float:
+        return self.source.program(conductance)
+
+    def read(self, voltage: float) -> float:
+        """Interpolated current at the source model's current conductance."""
+        return float(self.interpolate(self.source.current_conductance, voltage))
+
+    def update_drift(self, time_elapsed: float):
+        self.source.update_drift(time_elapsed)
+
+    def inject_noise(self) -> float:
+        return self.source.inject_noise()
+
+    def program_array(self, conductance: np.ndarray, rng: np.random.Generator = None) -> np.ndarray:
+        return self.source.program_array(conductance, rng)
+
+    def read_array(self, conductance: np.ndarray, voltage: np.ndarray) -> np.ndarray:
+        """Elementwise current from the table."""
+        return self.interpolate(conductance, voltage)
+
+    def drift_array(self, conductance: np.ndarray, time_elapsed: float) -> np.ndarray:
+        return self.source.drift_array(conductance, time_elapsed)
+
+    def noise_array(self, conductance: np.ndarray, rng: np.random.Generator = None) -> np.ndarray:
+        return self.source.noise_array(conductance, rng)
+
+    def noise_moments(self, conductance: np.ndarray):
+        return self.source.noise_moments(conductance)
@@ -0,0 +1,57 @@
+"""
+Multi-level cell (MLC) conductance levels for NeuraEdge.
+A cell holds one of a few distinguishable levels, so crossbar state is a
+uint8 level-code array plus a small level table, and every conductance
+lookup is a table index.
+"""
+
+from typing import Sequence, Union
+import numpy as np
+
+
+class MLCLevels:
+    """Discrete conductance levels with a per-level spread."""
+
+    SPACINGS = ("linear", "log")
+
+    def __init__(self, n_levels: int, g_min: float, g_max: float, spacing: str = "linear",
+                 level_sigma: Union[float, Sequence[float]] = 0.0):
+        """
+        Args:
+            n_levels: Number of levels (2..254; two codes are kept for stuck cells)
+            g_min: Lowest level conductance
+            g_max: Highest level conductance
+            spacing: "linear" or "log" spacing between g_min and g_max
+            level_sigma: Std of each level's conductance relative to the level,
+                         one value for all levels or one per level
+        """
+        if not 2 <= n_levels <= 254:
+            raise ValueError(f"n_levels must be in [2, 254], got {n_levels}")
+        if spacing not in self.SPACINGS:
+            raise ValueError(f"Unknown level spacing: {spacing}")
+        self.n_levels = n_levels
+        self.spacing = spacing
+        if spacing == "linear":
+            self.levels = np.linspace(g_min, g_max, n_levels)
+        else:
+            self.levels = np.geomspace(g_min, g_max, n_levels)
+        self.level_sigma = np.broadcast_to(np.asarray(level_sigma, dtype=float), (n_levels,))
+        # Absolute conductance std per level
+        self.sigma = self.level_sigma * self.levels
+        self._boundaries = (self.levels[1:] + self.levels[:-1]) / 2
+
+    def quantize(self, conductance: np.ndarray) -> np.ndarray:
+        """
+        Snap conductances to the nearest level.
+
+        Args:
+            conductance: Target conductances (any shape)
+
+        Returns:
+            Level codes (uint8, same shape)
+        """
+        return np.searchsorted(self._boundaries, conductance).astype(np.uint8)
+
+    def decode(self, codes: np.ndarray) -> np.ndarray:
+        """Level conductance for every code (table lookup)."""
+        return self.levels[codes]
@@ -1,54 +1,207 @@
 """
 Noise models for device variation and reliability analysis.
+
+GaussianNoise, LogNormalNoise and RandomTelegraphNoise double as array
+stages: apply() perturbs a whole (reads, ...) conductance array, and a
+NoisePipeline chains stages so noise sources stack without per-cell calls.
 """
 
 import numpy as np
-from typing import Callable
+from scipy.ndimage import binary_dilation
+from typing import Callable, List, Tuple
+from device_layer.random_streams import resolve_rng
 
 
 class GaussianNoise:
     """Gaussian noise model."""
 
-    def __init__(self, std_dev: float):
+    def __init__(self, std_dev: float, relative: bool = False, rng: np.random.Generator = None):
+        """
+        Args:
+            std_dev: Noise standard deviation
+            relative: Scale noise by |value| in apply() (conductance-proportional)
+            rng: Generator (None uses the global np.random state)
+        """
         self.std_dev = std_dev
+        self.relative = relative
+        self.rng = resolve_rng(rng)
 
     def sample(self) -> float:
-        return np.random.normal(0, self.std_dev)
+        return self.rng.normal(0, self.std_dev)
+
+    def apply(self, values: np.ndarray, rng: np.random.Generator = None) -> np.ndarray:
+        """Add independent Gaussian noise to every element."""
+        noise = (self.rng if rng is None else rng).normal(0, self.std_dev, np.shape(values))
+        if self.relative:
+            noise = noise * np.abs(values)
+        return values + noise
 
 
 class LogNormalNoise:
     """Log-normal noise model (realistic for PCM/ReRAM)."""
 
-    def __init__(self, sigma: float):
+    def __init__(self, sigma: float, rng: np.random.Generator = None):
         self.sigma = sigma
+        self.rng = resolve_rng(rng)
 
     def sample(self) -> float:
-        return np.random.lognormal(0, self.sigma) - 1.0
+        return self.rng.lognormal(0, self.sigma) - 1.0
 
+    def apply(self, values: np.ndarray, rng: np.random.Generator = None) -> np.ndarray:
+        """Scale every element by an independent log-normal factor."""
+        return values * (self.rng if rng is None else rng).lognormal(0, self.sigma, np.shape(values))
 
-class RandomTelegraphNoise:
-    """RTN: random two-level fluctuations."""
 
-    def __init__(self, amplitude: float, frequency: float):
+class RandomTelegraphNoise:
+    """
+    RTN: random two-level fluctuations.
+    In apply() every cell carries its own two-state Markov chain that
+    flips with probability `frequency` per read, and the fluctuation is
+    a fraction `amplitude` of the cell's conductance.
+    """
+
+    def __init__(self, amplitude: float, frequency: float, rng: np.random.Generator = None):
+        """
+        Args:
+            amplitude: Fluctuation size (absolute in sample(), relative in apply())
+            frequency: Flip probability per sample/read
+            rng: Generator (None uses the global np.random state)
+        """
         self.amplitude = amplitude
         self.frequency = frequency
-        self.state = np.random.choice([-1, 1])
+        self.rng = resolve_rng(rng)
+        self.state = self.rng.choice([-1, 1])
+        # Per-cell states (+1/-1), created on the first apply()
+        self.states = None
 
     def sample(self) -> float:
-        if np.random.rand() < self.frequency:
+        if self.rng.random() < self.frequency:
             self.state = -self.state
         return self.amplitude * self.state
 
+    def apply(self, values: np.ndarray, rng: np.random.Generator = None) -> np.ndarray:
+        """
+        Advance every cell's chain over a train of reads and apply it.
+        Axis 0 of values indexes successive reads; the state after read t
+        is the initial state flipped by the parity of flips up to t.
+
+        Args:
+            values: Conductances (reads, ...)
+            rng: Generator for flips (defaults to the stage's own)
+
+        Returns:
+            Perturbed conductances (same shape)
+        """
+        rng = self.rng if rng is None else rng
+        cell_shape = np.shape(values)[1:]
+        if self.states is None or self.states.shape != cell_shape:
+            self.states = rng.choice(np.array([-1, 1]), size=cell_shape)
+        flips = rng.random(np.shape(values)) < self.frequency
+        parity = np.cumsum(flips, axis=0) & 1
+        states = np.where(parity, -self.states, self.states)
+        self.states = states[-1]
+        return values * (1.0 + self.amplitude * states)
+
+
+class NoisePipeline:
+    """Ordered chain of array noise stages applied to cell conductances."""
+
+    def __init__(self, stages: List = None):
+        """
+        Args:
+            stages: Objects with apply(values, rng) -> values, run in order
+        """
+        self.stages = list(stages or [])
+
+    def __len__(self) -> int:
+        return len(self.stages)
+
+    def add(self, stage) -> "NoisePipeline":
+        """Append a stage; returns the pipeline for chaining."""
+        self.stages.append(stage)
+        return self
+
+    def apply(self, values: np.ndarray, rng: np.random.Generator = None) -> np.ndarray:
+        """
+        Run every stage over a (reads, ...) array.
+
+        Args:
+            values: Conductances (reads, ...); axis 0 indexes successive reads
+            rng: Generator shared by all stages (e.g. the tile's stream)
+
+        Returns:
+            Noisy conductances (same shape)
+        """
+        for stage in self.stages:
+            values = stage.apply(values, rng)
+        return values
+
 
 class StuckAtFault:
     """Stuck-at fault generator for reliability testing."""
 
-    def __init__(self, fault_rate: float):
+    def __init__(self, fault_rate: float, rng: np.random.Generator = None):
         self.fault_rate = fault_rate
-        self.is_faulty = np.random.rand() < fault_rate
-        self.stuck_value = np.random.choice([-1, 1]) if self.is_faulty else 0
+        rng = resolve_rng(rng)
+        self.is_faulty = rng.random() < fault_rate
+        self.stuck_value = rng.choice([-1, 1]) if self.is_faulty else 0
 
     def apply(self, value: float) -> float:
         if self.is_faulty:
             return self.stuck_value
         return value
+
+
+class StuckAtFaultMap:
+    """
+    Vectorized stuck-at-Gmin / stuck-at-Gmax fault masks.
+    Leading dimensions beyond (rows, cols) index independent chips/tiles,
+    so whole fault campaigns are a single mask array.
+    """
+
+    PATTERNS = ("random", "row", "column", "clustered")
+
+    def __init__(self, shape: Tuple[int, ...], fault_rate: float, g_min: float, g_max: float,
+                 pattern: str = "random", stuck_max_fraction: float = 0.5,
+                 cluster_radius: int = 1, rng: np.random.Generator = None):
+        """
+        Args:
+            shape: Mask shape (..., rows, cols)
+            fault_rate: Expected fraction of faulty cells
+            g_min: Conductance of stuck-at-Gmin cells
+            g_max: Conductance of stuck-at-Gmax cells
+            pattern: "random", "row", "column" or "clustered"
+            stuck_max_fraction: Fraction of faults stuck at Gmax
+            cluster_radius: Half-width of square fault clusters
+            rng: Generator (e.g. a per-tile fault stream)
+        """
+        if pattern not in self.PATTERNS:
+            raise ValueError(f"Unknown fault pattern: {pattern}")
+        rng = resolve_rng(rng)
+        self.fault_rate = fault_rate
+        self.pattern = pattern
+
+        if pattern == "random":
+            faulty = rng.random(shape) < fault_rate
+        elif pattern == "row":
+            faulty = np.broadcast_to(rng.random(shape[:-1] + (1,)) < fault_rate, shape)
+        elif pattern == "column":
+            faulty = np.broadcast_to(rng.random(shape[:-2] + (1, shape[-1])) < fault_rate, shape)
+        else:
+            width = 2 * cluster_radius + 1
+            seeds = rng.random(shape) < fault_rate / width ** 2
+            structure = np.ones((1,) * (len(shape) - 2) + (width, width), dtype=bool)
+            faulty = binary_dilation(seeds, structure=structure)
+
+        self.faulty = np.array(faulty, dtype=bool)
+        self.stuck_at_max = self.faulty & (rng.random(shape) < stuck_max_fraction)
+        self.stuck_at_min = self.faulty & ~self.stuck_at_max
+        self.stuck_conductance = np.where(self.stuck_at_max, g_max, g_min)
+
+    def apply(self, conductance: np.ndarray) -> np.ndarray:
+        """Force faulty cells to their stuck conductance."""
+        return np.where(self.faulty, self.stuck_conductance, conductance)
+
+    def get_fault_fraction(self) -> float:
+        """Return the realized fraction of faulty cells."""
+        return float(self.faulty.mean())
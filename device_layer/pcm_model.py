@@ -3,29 +3,39 @@ PCM (Phase Change Memory) device model for NeuraEdge.
 Implements chalcogenide glass conductance dynamics.
 """
 
-from device_layer.base_device import DeviceModel
+from device_layer.base_device import DeviceEnergy, DeviceModel
+from device_layer.drift_models import PowerLawDrift
 import numpy as np
 
 
 class PCMModel(DeviceModel):
     """Phase Change Memory device model."""
 
-    def __init__(self, max_conductance: float = 1e-4, min_conductance: float = 1e-6):
-        super().__init__("PCM")
+    energy = DeviceEnergy(mac_pj=0.2, write_pulse_pj=20.0, verify_read_pj=0.2)
+
+    def __init__(self, max_conductance: float = 1e-4, min_conductance: float = 1e-6,
+                 rng: np.random.Generator = None):
+        super().__init__("PCM", rng)
         self.max_conductance = max_conductance
         self.min_conductance = min_conductance
         self.current_conductance = (max_conductance + min_conductance) / 2
         self.drift_coefficient = 0.05
+        # Drift exponent nu of G(t) = G0 * (t / t0)^-nu
+        self.drift_model = PowerLawDrift(nu=self.drift_coefficient)
+        self.programmed_conductance = self.current_conductance
+        self.drift_age = 0.0
         self.noise_std = 0.03
         self.crystallinity = 0.5
 
     def program(self, conductance: float) -> float:
         """Program to target conductance with PCM-specific variation."""
         target = np.clip(conductance, self.min_conductance, self.max_conductance)
-        variation = np.random.normal(0, self.noise_std * target)
+        variation = self._rng().normal(0, self.noise_std * target)
         self.current_conductance = np.clip(target + variation,
                                           self.min_conductance,
                                           self.max_conductance)
+        self.programmed_conductance = self.current_conductance
+        self.drift_age = 0.0
         return self.current_conductance
 
     def read(self, voltage: float) -> float:
@@ -35,11 +45,39 @@ class PCMModel(DeviceModel):
 
     def update_drift(self, time_elapsed: float):
         """PCM has stronger drift than ReRAM."""
-        drift = self.current_conductance * self.drift_coefficient * (time_elapsed / 1000)
-        self.current_conductance = np.clip(self.current_conductance - drift,
-                                          self.min_conductance,
-                                          self.max_conductance)
+        self.drift_age += time_elapsed
+        self.current_conductance = self.drift_array(self.programmed_conductance, self.drift_age)
 
     def inject_noise(self) -> float:
         """Return log-normal noise (more realistic for PCM)."""
-        return np.random.lognormal(0, self.noise_std * 0.5) - 1.0
+        return self._rng().lognormal(0, self.noise_std * 0.5) - 1.0
+
+    def program_array(self, conductance: np.ndarray, rng: np.random.Generator = None) -> np.ndarray:
+        """Program an array of cells with PCM-specific variation."""
+        target = np.clip(conductance, self.min_conductance, self.max_conductance)
+        variation = self._rng(rng).normal(0, self.noise_std * target)
+        return np.clip(target + variation, self.min_conductance, self.max_conductance)
+
+    def read_array(self, conductance: np.ndarray, voltage: np.ndarray) -> np.ndarray:
+        """Elementwise ohmic current."""
+        return conductance * voltage
+
+    def read_columns(self, conductance: np.ndarray, voltages: np.ndarray) -> np.ndarray:
+        """Linear I-V: column currents are V @ G."""
+        return voltages @ conductance
+
+    def drift_array(self, conductance: np.ndarray, time_elapsed: float) -> np.ndarray:
+        """Power-law drift evaluated in closed form."""
+        drifted = self.drift_model.conductance_at(conductance, time_elapsed)
+        return np.clip(drifted, self.min_conductance, self.max_conductance)
+
+    def noise_array(self, conductance: np.ndarray, rng: np.random.Generator = None) -> np.ndarray:
+        """Log-normal noise per cell (independent of conductance)."""
+        return self._rng(rng).lognormal(0, self.noise_std * 0.5, np.shape(conductance)) - 1.0
+
+    def noise_moments(self, conductance: np.ndarray):
+        """Moments of lognormal(0, sigma) - 1, identical for every cell."""
+        sigma2 = (self.noise_std * 0.5) ** 2
+        mean = np.full(np.shape(conductance), np.exp(sigma2 / 2) - 1.0)
+        var = np.full(np.shape(conductance), (np.exp(sigma2) - 1.0) * np.exp(sigma2))
+        return mean, var
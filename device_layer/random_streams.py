@@ -0,0 +1,68 @@
+"""
+Reproducible random streams for NeuraEdge simulations.
+Every tile and Monte Carlo instance draws from its own counter-based
+(Philox) generator derived from one root seed, so results are identical
+whether tiles run serially, in threads or in processes.
+"""
+
+import numpy as np
+from typing import Optional
+
+# Stream families: each (family, index) pair maps to an independent stream
+TILE_STREAM = 0
+MONTE_CARLO_STREAM = 1
+FAULT_STREAM = 2
+VARIATION_STREAM = 3
+
+
+def make_generator(root_seed: int, *key: int) -> np.random.Generator:
+    """
+    Build a Philox generator for a stream key under a root seed.
+
+    Args:
+        root_seed: Root seed shared by the whole simulation
+        key: Stream key (e.g. family, index)
+
+    Returns:
+        Independent generator for that key
+    """
+    seed_seq = np.random.SeedSequence(root_seed, spawn_key=key)
+    return np.random.Generator(np.random.Philox(seed_seq))
+
+
+def resolve_rng(rng):
+    """Return rng, or the legacy global np.random state when rng is None."""
+    return np.random if rng is None else rng
+
+
+class RandomStreams:
+    """Derives per-tile and per-instance generators from one root seed."""
+
+    def __init__(self, root_seed: Optional[int] = None):
+        """
+        Args:
+            root_seed: Root seed (fresh OS entropy if None; stored for replay)
+        """
+        if root_seed is None:
+            root_seed = np.random.SeedSequence().entropy
+        self.root_seed = root_seed
+
+    def stream(self, family: int, index: int) -> np.random.Generator:
+        """Return the generator for (family, index)."""
+        return make_generator(self.root_seed, family, index)
+
+    def tile(self, tile_id: int) -> np.random.Generator:
+        """Return the generator owned by a tile."""
+        return self.stream(TILE_STREAM, tile_id)
+
+    def monte_carlo(self, instance: int) -> np.random.Generator:
+        """Return the generator for a Monte Carlo instance."""
+        return self.stream(MONTE_CARLO_STREAM, instance)
+
+    def faults(self, tile_id: int) -> np.random.Generator:
+        """Return the generator for a tile's (fixed) fault map."""
+        return self.stream(FAULT_STREAM, tile_id)
+
+    def variation(self, tile_id: int) -> np.random.Generator:
+        """Return the generator for a tile's (fixed) device-to-device variation map."""
+        return self.stream(VARIATION_STREAM, tile_id)
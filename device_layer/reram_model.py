@@ -3,29 +3,39 @@ ReRAM (Resistive RAM) device model for NeuraEdge.
 Implements conductive filament dynamics and nonlinear I-V behavior.
 """
 
-from device_layer.base_device import DeviceModel
+from device_layer.base_device import DeviceEnergy, DeviceModel
+from device_layer.drift_models import PowerLawDrift
 import numpy as np
 
 
 class ReRAMModel(DeviceModel):
     """Resistive RAM device model."""
 
-    def __init__(self, max_conductance: float = 1e-4, min_conductance: float = 1e-6):
-        super().__init__("ReRAM")
+    energy = DeviceEnergy(mac_pj=0.15, write_pulse_pj=5.0, verify_read_pj=0.15)
+
+    def __init__(self, max_conductance: float = 1e-4, min_conductance: float = 1e-6,
+                 rng: np.random.Generator = None):
+        super().__init__("ReRAM", rng)
         self.max_conductance = max_conductance
         self.min_conductance = min_conductance
         self.current_conductance = (max_conductance + min_conductance) / 2
         self.drift_coefficient = 0.001
+        # Drift exponent nu of G(t) = G0 * (t / t0)^-nu
+        self.drift_model = PowerLawDrift(nu=self.drift_coefficient)
+        self.programmed_conductance = self.current_conductance
+        self.drift_age = 0.0
         self.noise_std = 0.02
 
     def program(self, conductance: float) -> float:
         """Program to target conductance with variation."""
         target = np.clip(conductance, self.min_conductance, self.max_conductance)
         # Add programming variation
-        variation = np.random.normal(0, self.noise_std * target)
+        variation = self._rng().normal(0, self.noise_std * target)
         self.current_conductance = np.clip(target + variation,
                                           self.min_conductance,
                                           self.max_conductance)
+        self.programmed_conductance = self.current_conductance
+        self.drift_age = 0.0
         return self.current_conductance
 
     def read(self, voltage: float) -> float:
@@ -36,11 +46,36 @@ class ReRAMModel(DeviceModel):
 
     def update_drift(self, time_elapsed: float):
         """Simulate temporal drift (conductance decay)."""
-        drift = self.current_conductance * self.drift_coefficient * (time_elapsed / 1000)
-        self.current_conductance = np.clip(self.current_conductance - drift,
-                                          self.min_conductance,
-                                          self.max_conductance)
+        self.drift_age += time_elapsed
+        self.current_conductance = self.drift_array(self.programmed_conductance, self.drift_age)
 
     def inject_noise(self) -> float:
         """Return Gaussian noise contribution."""
-        return np.random.normal(0, self.noise_std * self.current_conductance)
+        return self._rng().normal(0, self.noise_std * self.current_conductance)
+
+    def program_array(self, conductance: np.ndarray, rng: np.random.Generator = None) -> np.ndarray:
+        """Program an array of cells with per-cell variation."""
+        target = np.clip(conductance, self.min_conductance, self.max_conductance)
+        variation = self._rng(rng).normal(0, self.noise_std * target)
+        return np.clip(target + variation, self.min_conductance, self.max_conductance)
+
+    def read_array(self, conductance: np.ndarray, voltage: np.ndarray) -> np.ndarray:
+        """Elementwise ohmic current plus quadratic nonlinearity."""
+        return conductance * voltage + 0.1 * (voltage ** 2) * conductance
+
+    def read_columns(self, conductance: np.ndarray, voltages: np.ndarray) -> np.ndarray:
+        """I = (V + 0.1 V^2) G is separable, so column sums are one matmul."""
+        return (voltages + 0.1 * voltages ** 2) @ conductance
+
+    def drift_array(self, conductance: np.ndarray, time_elapsed: float) -> np.ndarray:
+        """Power-law drift evaluated in closed form."""
+        drifted = self.drift_model.conductance_at(conductance, time_elapsed)
+        return np.clip(drifted, self.min_conductance, self.max_conductance)
+
+    def noise_array(self, conductance: np.ndarray, rng: np.random.Generator = None) -> np.ndarray:
+        """Gaussian noise proportional to each cell's conductance."""
+        return self._rng(rng).normal(0, self.noise_std * conductance)
+
+    def noise_moments(self, conductance: np.ndarray):
+        """Zero-mean Gaussian with std proportional to conductance."""
+        return np.zeros_like(conductance), (self.noise_std * conductance) ** 2
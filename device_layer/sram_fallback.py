@@ -3,15 +3,18 @@ SRAM fallback model for NeuraEdge.
 Used when ReRAM/PCM unavailable or for comparison.
 """
 
-from device_layer.base_device import DeviceModel
+from device_layer.base_device import DeviceEnergy, DeviceModel
 import numpy as np
 
 
 class SRAMFallbackModel(DeviceModel):
     """Ideal SRAM device model (minimal noise/drift)."""
 
-    def __init__(self, max_conductance: float = 1e-4, min_conductance: float = 1e-6):
-        super().__init__("SRAM")
+    energy = DeviceEnergy(mac_pj=0.05, write_pulse_pj=0.5, verify_read_pj=0.05)
+
+    def __init__(self, max_conductance: float = 1e-4, min_conductance: float = 1e-6,
+                 rng: np.random.Generator = None):
+        super().__init__("SRAM", rng)
         self.max_conductance = max_conductance
         self.min_conductance = min_conductance
         self.current_conductance = (max_conductance + min_conductance) / 2
@@ -21,7 +24,7 @@ class SRAMFallbackModel(DeviceModel):
     def program(self, conductance: float) -> float:
         """Program with minimal variation."""
         target = np.clip(conductance, self.min_conductance, self.max_conductance)
-        variation = np.random.normal(0, self.noise_std * target)
+        variation = self._rng().normal(0, self.noise_std * target)
         self.current_conductance = np.clip(target + variation,
                                           self.min_conductance,
                                           self.max_conductance)
@@ -37,4 +40,30 @@ class SRAMFallbackModel(DeviceModel):
 
     def inject_noise(self) -> float:
         """Return minimal noise."""
-        return np.random.normal(0, self.noise_std * self.current_conductance)
+        return self._rng().normal(0, self.noise_std * self.current_conductance)
+
+    def program_array(self, conductance: np.ndarray, rng: np.random.Generator = None) -> np.ndarray:
+        """Program an array of cells with minimal variation."""
+        target = np.clip(conductance, self.min_conductance, self.max_conductance)
+        variation = self._rng(rng).normal(0, self.noise_std * target)
+        return np.clip(target + variation, self.min_conductance, self.max_conductance)
+
+    def read_array(self, conductance: np.ndarray, voltage: np.ndarray) -> np.ndarray:
+        """Elementwise ideal ohmic current."""
+        return conductance * voltage
+
+    def read_columns(self, conductance: np.ndarray, voltages: np.ndarray) -> np.ndarray:
+        """Linear I-V: column currents are V @ G."""
+        return voltages @ conductance
+
+    def drift_array(self, conductance: np.ndarray, time_elapsed: float) -> np.ndarray:
+        """SRAM has negligible drift."""
+        return np.array(conductance, copy=True)
+
+    def noise_array(self, conductance: np.ndarray, rng: np.random.Generator = None) -> np.ndarray:
+        """Minimal Gaussian noise per cell."""
+        return self._rng(rng).normal(0, self.noise_std * conductance)
+
+    def noise_moments(self, conductance: np.ndarray):
+        """Zero-mean Gaussian with std proportional to conductance."""
+        return np.zeros_like(conductance), (self.noise_std * conductance) ** 2
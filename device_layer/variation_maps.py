@@ -0,0 +1,121 @@
+"""
+Device-to-device variation maps for NeuraEdge.
+Every cell of a chip has a fixed programming gain and offset, drawn once
+from the chip seed. Cycle-to-cycle variation is still drawn by the device
+model on every write; the map is the part that stays the same each time
+"the same chip" is reprogrammed, so it is shared in memory while any tile
+holds it and can be persisted to disk.
+"""
+
+import hashlib
+import json
+import os
+import weakref
+from typing import Optional, Tuple
+import numpy as np
+from device_layer.random_streams import RandomStreams
+
+
+class DeviceVariationMap:
+    """Fixed per-cell programming gain and offset of one crossbar."""
+
+    def __init__(self, gain: np.ndarray, offset: np.ndarray):
+        """
+        Args:
+            gain: Multiplicative programming error per cell (~1)
+            offset: Additive programming error per cell (S)
+        """
+        self.gain = gain
+        self.offset = offset
+
+    @classmethod
+    def generate(cls, shape: Tuple[int, ...], gain_sigma: float, offset_sigma: float,
+                 g_max: float, rng: np.random.Generator) -> "DeviceVariationMap":
+        """
+        Draw a variation map. Maps are stored as float32; the deviations
+        are a few percent, far above float32 resolution.
+
+        Args:
+            shape: Cell array shape (rows, physical_columns)
+            gain_sigma: Std of the per-cell gain around 1
+            offset_sigma: Std of the per-cell offset, relative to g_max
+            g_max: Maximum device conductance
+            rng: Generator (e.g. a per-tile variation stream)
+
+        Returns:
+            Variation map
+        """
+        gain = 1.0 + gain_sigma * rng.standard_normal(shape)
+        offset = offset_sigma * g_max * rng.standard_normal(shape)
+        return cls(gain.astype(np.float32), offset.astype(np.float32))
+
+    def apply(self, conductance: np.ndarray, g_min: float, g_max: float,
+              cells: Tuple[np.ndarray, ...] = None) -> np.ndarray:
+        """
+        Distort programmed conductances by each cell's gain and offset.
+
+        Args:
+            conductance: Programmed conductances (whole array, or the cells selected)
+            g_min: Minimum device conductance
+            g_max: Maximum device conductance
+            cells: Index arrays of the cells in conductance (None for the whole array)
+
+        Returns:
+            Conductances clipped to [g_min, g_max]
+        """
+        if cells is None:
+            return np.clip(self.gain * conductance + self.offset, g_min, g_max)
+        return np.clip(self.gain[cells] * conductance + self.offset[cells], g_min, g_max)
+
+
+# Maps still held by some tile, keyed by variation_map_key. Weak values keep
+# campaigns over many chip seeds from accumulating every map ever drawn;
+# cache_dir makes reloading a released map cheap.
+_MAP_CACHE = weakref.WeakValueDictionary()
+
+
+def variation_map_key(root_seed: int, tile_id: int, shape: Tuple[int, ...], gain_sigma: float,
+                      offset_sigma: float, g_max: float) -> str:
+    """Hash of everything a variation map is generated from."""
+    spec = {
+        "root_seed": int(root_seed), "tile_id": tile_id, "shape": list(shape),
+        "gain_sigma": gain_sigma, "offset_sigma": offset_sigma, "g_max": g_max,
+    }
+    return hashlib.sha256(json.dumps(spec, sort_keys=True).encode()).hexdigest()[:16]
+
+
+def load_variation_map(root_seed: int, tile_id: int, shape: Tuple[int, ...], gain_sigma: float,
+                       offset_sigma: float, g_max: float,
+                       cache_dir: Optional[str] = None) -> DeviceVariationMap:
+    """
+    Return a tile's variation map, generating it only on the first request.
+    Maps are looked up in memory (while still referenced), then in
+    cache_dir (as d2d_{key}.npz);
+    new maps are drawn from the tile's variation stream of root_seed.
+
+    Args:
+        root_seed: Chip seed (see RandomStreams)
+        tile_id: Tile the map belongs to
+        shape: Cell array shape (rows, physical_columns)
+        gain_sigma: Std of the per-cell gain around 1
+        offset_sigma: Std of the per-cell offset, relative to g_max
+        g_max: Maximum device conductance
+        cache_dir: Directory for persisted maps (None keeps them in memory)
+
+    Returns:
+        Variation map
+    """
+    key = variation_map_key(root_seed, tile_id, shape, gain_sigma, offset_sigma, g_max)
+    path = None if cache_dir is None else os.path.join(cache_dir, f"d2d_{key}.npz")
+    variation_map = _MAP_CACHE.get(key)
+    if variation_map is None and path is not None and os.path.exists(path):
+        with np.load(path) as data:
+            variation_map = DeviceVariationMap(data["gain"], data["offset"])
+    elif variation_map is None:
+        rng = RandomStreams(root_seed).variation(tile_id)
+        variation_map = DeviceVariationMap.generate(shape, gain_sigma, offset_sigma, g_max, rng)
+    if path is not None and not os.path.exists(path):
+        os.makedirs(cache_dir, exist_ok=True)
+        np.savez(path, gain=variation_map.gain, offset=variation_map.offset)
+    _MAP_CACHE[key] = variation_map
+    return variation_map
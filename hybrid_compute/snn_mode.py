@@ -34,7 +34,7 @@ class SNNMode:
         if timesteps is None:
             timesteps = self.timesteps
 
-        spike_counts = np.zeros(self.tile_manager.tile_size)
+        spike_counts = np.zeros(self.tile_manager.get_tile(tile_id).neurons.size)
 
         # Ensure inputs are (timesteps, neurons)
         if inputs.ndim == 1:
@@ -48,11 +48,8 @@ class SNNMode:
                 inputs = np.vstack([inputs, padding])
 
         # Simulate SNN
-        for t in range(timesteps):
-            input_vec = inputs[t]
-            spikes = self.tile_manager.execute(tile_id, input_vec, dt=1.0)
-            if isinstance(spikes, np.ndarray):
-                spike_counts[spikes] += 1
+        for spikes in self.tile_manager.execute_batch(tile_id, inputs, dt=1.0):
+            spike_counts[spikes] += 1
 
         return spike_counts
 
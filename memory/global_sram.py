@@ -4,17 +4,20 @@ Global SRAM for NeuraEdge platform.
 
 import numpy as np
 from typing import Optional
+from architecture.precision import PrecisionPolicy
 
 
 class GlobalSRAM:
     """Global memory for inter-tile communication and buffering."""
 
-    def __init__(self, size_kB: int = 256):
+    def __init__(self, size_kB: int = 256, precision: PrecisionPolicy = None):
         """
         Args:
             size_kB: Memory size in kilobytes
+            precision: Word dtype from the storage precision (None keeps float32 words)
         """
         self.size_bytes = size_kB * 1024
+        self.dtype = np.dtype(np.float32) if precision is None else precision.storage_dtype
         self.memory = bytearray(self.size_bytes)
         self.read_counter = 0
         self.write_counter = 0
@@ -45,7 +48,7 @@ class GlobalSRAM:
 
     def write(self, address: int, data: np.ndarray):
         """Write data to memory."""
-        data_bytes = data.astype(np.float32).tobytes()
+        data_bytes = data.astype(self.dtype).tobytes()
         self.memory[address : address + len(data_bytes)] = data_bytes
         self.write_counter += 1
 
@@ -53,7 +56,7 @@ class GlobalSRAM:
         """Read data from memory."""
         data_bytes = bytes(self.memory[address : address + size_bytes])
         self.read_counter += 1
-        return np.frombuffer(data_bytes, dtype=np.float32)
+        return np.frombuffer(data_bytes, dtype=self.dtype)
 
     def get_utilization(self) -> float:
         """Return memory utilization (0-1)."""
@@ -3,15 +3,24 @@ Weight loader for programming crossbar arrays.
 """
 
 import numpy as np
-from typing import Optional
+from typing import Optional, Tuple, Union
 
 
 class WeightLoader:
     """Handles weight programming to tiles."""
 
-    def __init__(self, num_tiles: int, tile_size: int):
+    def __init__(self, num_tiles: int, tile_size: Union[int, Tuple[int, int]], tile_manager=None):
+        """
+        Args:
+            num_tiles: Number of tiles
+            tile_size: Weight shape per tile: n for n x n, or (rows, cols)
+            tile_manager: Optional TileManager; when given, loads are also
+                          written to the tiles (and counted as cell writes)
+        """
         self.num_tiles = num_tiles
         self.tile_size = tile_size
+        self.tile_shape = (tile_size, tile_size) if np.isscalar(tile_size) else tuple(tile_size)
+        self.tile_manager = tile_manager
         self.loaded_weights = {}
 
     def load_weights(self, tile_id: int, weights: np.ndarray) -> bool:
@@ -25,12 +34,20 @@ class WeightLoader:
         Returns:
             True if successful
         """
-        if weights.shape != (self.tile_size, self.tile_size):
+        if weights.shape != self.get_weight_shape(tile_id):
             return False
 
         self.loaded_weights[tile_id] = weights.copy()
+        if self.tile_manager is not None:
+            self.tile_manager.program_tile(tile_id, weights)
         return True
 
+    def get_weight_shape(self, tile_id: int) -> Tuple[int, int]:
+        """Weight shape for a tile (from the bound TileManager when there is one)."""
+        if self.tile_manager is not None:
+            return self.tile_manager.get_weight_shape(tile_id)
+        return self.tile_shape
+
     def get_weights(self, tile_id: int) -> Optional[np.ndarray]:
         """Retrieve loaded weights for tile."""
         return self.loaded_weights.get(tile_id)
@@ -49,7 +66,7 @@ class WeightLoader:
             True if successful
         """
         if tile_id not in self.loaded_weights:
-            self.loaded_weights[tile_id] = np.zeros((self.tile_size, self.tile_size))
+            self.loaded_weights[tile_id] = np.zeros(self.get_weight_shape(tile_id))
 
         rows, cols = weights.shape
         self.loaded_weights[tile_id][
@@ -57,6 +74,8 @@ class WeightLoader:
             col_start : col_start + cols
         ] = weights
 
+        if self.tile_manager is not None:
+            self.tile_manager.program_tile_region(tile_id, weights, row_start, col_start)
         return True
 
     def verify_loaded(self, tile_id: int, expected: np.ndarray) -> bool:
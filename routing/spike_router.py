@@ -5,6 +5,7 @@ Spike router for NeuraEdge multi-tile communication.
 import numpy as np
 from dataclasses import dataclass
 from typing import List, Tuple
+from architecture.precision import PrecisionPolicy, resolve_precision
 
 
 @dataclass
@@ -21,8 +22,14 @@ class SpikePacket:
 class SpikeRouter:
     """Routes spike packets between tiles."""
 
-    def __init__(self, num_tiles: int):
+    def __init__(self, num_tiles: int, precision: PrecisionPolicy = None):
+        """
+        Args:
+            num_tiles: Number of tiles
+            precision: Storage dtype of packet payloads
+        """
         self.num_tiles = num_tiles
+        self.precision = resolve_precision(precision)
         self.packet_buffer = [[] for _ in range(num_tiles)]
         self.routing_table = self._init_routing_table()
         self.total_packets_routed = 0
@@ -32,14 +39,16 @@ class SpikeRouter:
         source_tile: int,
         dest_tile: int,
         neuron_id: int,
-        timestamp: int
+        timestamp: int,
+        payload: float = 1.0
     ) -> SpikePacket:
-        """Create spike packet."""
+        """Create spike packet (payload held in the storage dtype)."""
         return SpikePacket(
             source_tile_id=source_tile,
             dest_tile_id=dest_tile,
             neuron_id=neuron_id,
-            timestamp=timestamp
+            timestamp=timestamp,
+            payload=self.precision.storage_dtype.type(payload)
         )
 
     def route_spike(self, packet: SpikePacket) -> bool:
@@ -16,7 +16,7 @@ class MultiTileSimulator:
         """
         self.tile_manager = tile_manager
         self.num_tiles = num_tiles
-        self.router = SpikeRouter(num_tiles)
+        self.router = SpikeRouter(num_tiles, precision=tile_manager.precision)
         self.cycle_count = 0
 
     def execute_timestep(self, tile_inputs: dict) -> dict:
@@ -29,13 +29,10 @@ class MultiTileSimulator:
         Returns:
             Spike outputs per tile
         """
-        outputs = {}
-
-        # Execute all tiles
-        for tile_id, inputs in tile_inputs.items():
-            spikes = self.tile_manager.execute(tile_id, inputs, dt=1.0)
-            outputs[tile_id] = spikes
+        # Execute all tiles for the same timestep (time advances once)
+        outputs = self.tile_manager.execute_parallel(tile_inputs, dt=1.0)
 
+        for tile_id, spikes in outputs.items():
             # Route spikes to other tiles
             for spike_idx in spikes:
                 for dest_tile in range(self.num_tiles):
@@ -20,6 +20,7 @@ import plotly.express as px
 # Now import NeuraEdge components
 from api.neuraedge_api import NeuraEdge
 from ui.dashboard import Dashboard
+from device_layer.random_streams import make_generator
 
 
 def _hex_to_rgb(hex_color: str) -> list:
@@ -458,11 +459,14 @@ with tab1:
     with h2:
         st.markdown('<p class="section-header">Tile Comparison</p>', unsafe_allow_html=True)
         tile_ids = list(range(num_tiles))
-        energies = []
+        # Non-resident tiles report zero without being built
+        energies = ne.tile_manager.get_power_summary()["per_tile"]
         spikes = []
         for tid in tile_ids:
+            if not ne.tile_manager.is_resident(tid):
+                spikes.append(0.0)
+                continue
             t = ne.tile_manager.get_tile(tid)
-            energies.append(t.power_monitor.get_total_energy())
             spikes.append(float(np.sum(t.neurons.get_spike_counts())))
         fig_tiles = go.Figure()
         fig_tiles.add_trace(go.Bar(
@@ -513,12 +517,12 @@ with tab2:
 
     if run_clicked:
         with st.spinner("Running inference..."):
-            np.random.seed(42 + st.session_state.run_count)
-            inputs = np.random.rand(tile_size)
+            rng = make_generator(42, st.session_state.run_count)
+            inputs = rng.random(tile_size)
             inputs = (inputs > sparsity).astype(float)
 
             # Scale weights to ensure crossbar outputs can reach neuron threshold
-            weights = np.abs(np.random.randn(tile_size, tile_size)) * 2.0
+            weights = np.abs(rng.standard_normal((tile_size, tile_size))) * 2.0
             weights = weights / (weights.max() + 1e-8)  # normalize to [0, 1]
 
             ne.program_weights(tile_id, weights)
@@ -594,8 +598,8 @@ with tab2:
         threshold_val = tile_ref.neurons.neurons[0].threshold
 
         # Re-run a short simulation to capture per-timestep membrane data
-        np.random.seed(42 + st.session_state.run_count - 1)
-        sim_inputs = np.random.rand(tile_size)
+        rng = make_generator(42, st.session_state.run_count - 1)
+        sim_inputs = rng.random(tile_size)
         sim_inputs = (sim_inputs > sparsity).astype(float)
         # Reset neuron 0 for clean trace
         tile_ref.neurons.neurons[0].reset()
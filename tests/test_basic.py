@@ -5,6 +5,7 @@ import numpy as np
 from device_layer.reram_model import ReRAMModel
 from architecture.lif_neuron import LIFNeuron
 from architecture.crossbar_array import CrossbarArray
+from architecture.tile_manager import TileManager
 
 
 class TestReRAMDevice:
@@ -25,6 +26,96 @@ class TestReRAMDevice:
         current = device.read(0.5)
         assert current > 0
 
+    def test_array_api(self):
+        """Array kernels agree with the scalar interface."""
+        device = ReRAMModel()
+        device.program(1e-5)
+        g = np.full((4, 3), device.current_conductance)
+        np.testing.assert_allclose(device.read_array(g, 0.5), device.read(0.5))
+        voltages = np.random.rand(4)
+        np.testing.assert_allclose(
+            device.read_columns(g, voltages),
+            device.read_array(g, voltages[:, None]).sum(axis=0),
+        )
+        device.update_drift(10.0)
+        np.testing.assert_allclose(device.drift_array(g, 10.0), device.current_conductance)
+        programmed = device.program_array(np.full((8, 8), 5e-5))
+        assert programmed.shape == (8, 8)
+        assert np.all(programmed >= device.min_conductance)
+
+    def test_lut_iv_model(self, tmp_path):
+        """Tabulated I-V matches the source model and is cached on disk by parameters."""
+        from device_layer.lut_model import LUTDeviceModel
+        source = ReRAMModel()
+        lut = LUTDeviceModel(source, cache_dir=str(tmp_path))
+        g = np.random.uniform(source.min_conductance, source.max_conductance, (32, 32))
+        v = np.random.uniform(0, 1, (32, 1))
+        exact = source.read_array(g, v)
+        assert np.abs(lut.read_array(g, v) - exact).max() < 1e-3 * exact.max()
+
+        columns = lut.read_columns(g, v[:, 0])
+        np.testing.assert_allclose(columns, source.read_columns(g, v[:, 0]), rtol=1e-3)
+        crossbar = CrossbarArray(size=32, device_model=lut)
+        crossbar.program_weights(np.random.rand(32, 32))
+        assert crossbar.read_outputs(np.random.rand(32)).max() > 0
+
+        assert len(list(tmp_path.iterdir())) == 1
+        cached = LUTDeviceModel(ReRAMModel(), cache_dir=str(tmp_path))
+        np.testing.assert_array_equal(cached.table, lut.table)
+        other = ReRAMModel(max_conductance=2e-4)
+        assert LUTDeviceModel(other, cache_dir=str(tmp_path)).cache_key() != lut.cache_key()
+        assert len(list(tmp_path.iterdir())) == 2
+
+    def test_device_registry(self):
+        """Plugins resolve by name; scalar-only plugins get a warned vectorize fallback."""
+        from device_layer.base_device import DeviceEnergy, DeviceModel
+        from device_layer.device_config import DeviceConfig, DeviceFactory
+
+        class ScalarFeFET(DeviceModel):
+            def __init__(self, max_conductance=1e-4, min_conductance=1e-6, slope=2.0):
+                super().__init__("FeFET")
+                self.max_conductance = max_conductance
+                self.min_conductance = min_conductance
+                self.current_conductance = max_conductance / 2
+                self.slope = slope
+
+            def program(self, conductance):
+                self.current_conductance = float(np.clip(conductance, self.min_conductance,
+                                                         self.max_conductance))
+                return self.current_conductance
+
+            def read(self, voltage):
+                return self.current_conductance * voltage * self.slope
+
+            def update_drift(self, time_elapsed):
+                self.current_conductance *= 0.5
+
+            def inject_noise(self):
+                return 0.0
+
+        with pytest.warns(RuntimeWarning, match="np.vectorize"):
+            DeviceFactory.register("fefet", ScalarFeFET, parameters=("max_conductance", "slope"),
+                                   energy=DeviceEnergy(mac_pj=0.01))
+        try:
+            assert "fefet" in DeviceFactory.available()
+            device = DeviceFactory.create(DeviceConfig(device_type="fefet", device_params={"slope": 3.0}))
+            assert device.slope == 3.0 and device.energy.mac_pj == 0.01
+            g = np.full((4, 4), 1e-5)
+            np.testing.assert_allclose(device.read_array(g, 0.5), 1e-5 * 0.5 * 3.0)
+            np.testing.assert_allclose(device.drift_array(g, 1.0), 5e-6)
+            assert device.current_conductance == 5e-5
+            assert not hasattr(device, "programmed_conductance") and not hasattr(device, "drift_age")
+
+            tile_manager = TileManager(num_tiles=1, tile_size=8, device_model="fefet")
+            tile_manager.program_tile(0, np.random.rand(8, 8))
+            tile_manager.execute(0, np.ones(8))
+            monitor = tile_manager.get_tile(0).power_monitor
+            assert monitor.crossbar_energy == pytest.approx(8 * 8 * 0.01)
+        finally:
+            DeviceFactory.unregister("fefet")
+        with pytest.raises(ValueError):
+            DeviceFactory.create(DeviceConfig(device_type="fefet"))
+
 
 class TestLIFNeuron:
     """Test LIF neuron model."""
@@ -70,6 +161,813 @@ class TestCrossbar:
         outputs = crossbar.read_outputs(inputs)
         assert outputs.shape == (64,)
 
+    def test_matches_per_device_read(self):
+        """Vectorized read agrees with per-cell ReRAMModel reads."""
+        crossbar = CrossbarArray(size=16, device_model=ReRAMModel())
+        crossbar.program_weights(np.random.rand(16, 16))
+        inputs = np.random.rand(16)
+
+        expected = np.zeros(16)
+        device = ReRAMModel()
+        for i in range(16):
+            for j in range(16):
+                device.current_conductance = crossbar.conductances[i, j]
+                expected[j] += device.read(inputs[i])
+
+        np.testing.assert_allclose(crossbar._column_currents(inputs), expected, rtol=1e-10)
+
+    def test_read_batch(self):
+        """Batched read matches per-step reads up to noise and ADC rounding."""
+        np.random.seed(0)
+        crossbar = CrossbarArray(size=32, device_model=ReRAMModel())
+        crossbar.program_weights(0.5 + 0.5 * np.random.rand(32, 32))
+        inputs = (np.random.rand(10, 32) > 0.5).astype(float)
+        batch = crossbar.read_outputs_batch(inputs)
+        assert batch.shape == (10, 32)
+        sequential = np.array([crossbar.read_outputs(x) for x in inputs])
+        np.testing.assert_allclose(batch, sequential, rtol=0.05, atol=1e-6)
+
+    def test_sparse_read(self):
+        """Sparse gather, dense kernel and all-zero fast path agree."""
+        crossbar = CrossbarArray(size=64, device_model=ReRAMModel())
+        crossbar.program_weights(np.random.rand(64, 64))
+        inputs = np.zeros(64)
+        inputs[[3, 17, 40]] = 1.0
+        np.testing.assert_allclose(
+            crossbar._column_currents(inputs, np.flatnonzero(inputs)),
+            crossbar._column_currents(inputs),
+        )
+        np.testing.assert_array_equal(crossbar.read_outputs(np.zeros(64)), np.zeros(64))
+        batch = crossbar.read_outputs_batch(np.vstack([inputs, np.zeros(64), np.ones(64)]))
+        assert np.all(batch[1] == 0)
+        assert batch[0].max() > 0 and batch[2].max() > 0
+
+        # A sparse train is one crossbar product, not one per timestep
+        calls = []
+        read_columns = crossbar.device_model.read_columns
+        crossbar.device_model.read_columns = lambda g, v: calls.append(g.shape) or read_columns(g, v)
+        train = np.zeros((100, 64))
+        train[:, :6] = np.random.rand(100, 6) < 0.5
+        crossbar.read_cache_size = 0
+        crossbar.read_outputs_batch(train)
+        assert calls == [(6, 64)]
+
+    def test_aggregated_noise_equivalence(self):
+        """
+        Aggregated column noise is statistically equivalent to per-cell noise.
+        Column noise is a sum of independent per-cell samples, so both modes
+        must produce the same per-column mean and variance; we compare
+        2000 reads of each against the analytic moments.
+        """
+        from device_layer.pcm_model import PCMModel
+        for device in (ReRAMModel(), PCMModel()):
+            crossbar = CrossbarArray(size=32, device_model=device)
+            crossbar.program_weights(np.random.rand(32, 32))
+            mean, var = device.noise_moments(crossbar.conductances)
+            expected_mean, expected_std = mean.sum(axis=0), np.sqrt(var.sum(axis=0))
+
+            for mode in ("per_cell", "aggregated"):
+                crossbar.noise_mode = mode
+                samples = crossbar._column_noise(2000)
+                assert samples.shape == (2000, 32)
+                # Standard error of the mean is std / sqrt(2000)
+                np.testing.assert_allclose(
+                    samples.mean(axis=0), expected_mean, atol=5 * expected_std.max() / np.sqrt(2000)
+                )
+                np.testing.assert_allclose(samples.std(axis=0), expected_std, rtol=0.15)
+
+    def test_closed_form_drift(self):
+        """Drift depends only on total elapsed time, not on step count."""
+        from device_layer.pcm_model import PCMModel
+        ten_years_ms = 10 * 365 * 24 * 3600 * 1e3
+        one_shot = CrossbarArray(size=16, device_model=PCMModel())
+        one_shot.program_weights(np.random.rand(16, 16))
+        stepped = CrossbarArray(size=16, device_model=one_shot.device_model)
+        stepped.program_weights(np.ones((16, 16)))
+        stepped.programmed_conductances = one_shot.programmed_conductances
+
+        one_shot.update_drift(ten_years_ms)
+        for _ in range(100):
+            stepped.update_drift(ten_years_ms / 100)
+
+        np.testing.assert_allclose(one_shot.conductances, stepped.conductances)
+        # G(t) = G0 (t / t0)^-nu
+        expected = one_shot.programmed_conductances * (ten_years_ms / 1000.0) ** -0.05
+        np.testing.assert_allclose(
+            one_shot.conductances,
+            np.clip(expected, PCMModel().min_conductance, PCMModel().max_conductance),
+        )
+
+    def test_nodal_ir_drop(self):
+        """Nodal IR drop reduces currents, caches its factorization, and
+        converges to the ideal read as wire resistance vanishes."""
+        crossbar = CrossbarArray(size=16, device_model=ReRAMModel())
+        crossbar.program_weights(np.random.rand(16, 16))
+        crossbar.ir_drop_model = "nodal"
+        inputs = np.random.rand(5, 16)
+        ideal = crossbar._column_currents(inputs)
+
+        dropped = crossbar._nodal_currents(inputs)
+        assert np.all(dropped < ideal)
+        crossbar._nodal_currents(inputs)
+        assert crossbar.ir_solver.factorizations == 1
+
+        # A wire-resistance change alone refactorizes
+        crossbar.ir_solver.wire_resistance = 1e-6
+        np.testing.assert_allclose(crossbar._nodal_currents(inputs), crossbar._column_currents(inputs), rtol=1e-4)
+        assert crossbar.ir_solver.factorizations == 2
+
+        crossbar.update_drift(1e7)
+        crossbar._nodal_currents(inputs)
+        assert crossbar.ir_solver.factorizations == 3
+
+    def test_calibrated_adc(self):
+        """Fixed-range ADC: per-column calibration, resolution and saturation."""
+        crossbar = CrossbarArray(size=32, device_model=ReRAMModel())
+        crossbar.program_weights(np.random.rand(32, 32))
+        full_scale = crossbar.adc.offset + 1.0 / crossbar.adc.gain
+
+        inputs = np.random.rand(50, 32)
+        currents = crossbar._column_currents(inputs) * 0.95
+        for bits in (4, 8):
+            crossbar.adc_bits = bits
+            converted = crossbar._quantize_adc(currents)
+            assert converted.shape == (50, 32)
+            step = (full_scale - crossbar.adc.offset) / crossbar.adc.levels
+            assert np.all(np.abs(converted - currents) <= step / 2 + 1e-18)
+
+        saturated = crossbar._quantize_adc(np.tile(full_scale * 2, (3, 1)))
+        np.testing.assert_allclose(saturated, np.tile(full_scale, (3, 1)))
+        assert crossbar.adc.saturation_count == 3 * 32
+
+        # Read-setting changes recalibrate on the next read
+        crossbar.ir_drop_model = "nodal"
+        crossbar.read_outputs(np.ones(32))
+        assert crossbar.adc.saturation_count == 3 * 32
+        assert np.all(crossbar.adc.offset + 1.0 / crossbar.adc.gain > full_scale)
+
+        from device_layer.device_config import DeviceConfig
+        from device_layer.pcm_model import PCMModel
+        manager = TileManager(num_tiles=1, tile_size=16, device_model=PCMModel(),
+                              device_config=DeviceConfig(read_noise="pipeline", noise_level=0.01))
+        crossbar = manager.get_tile(0).crossbar
+        crossbar.read_outputs(np.ones(16))
+        assert np.all(crossbar.adc.offset == 0)
+
+    def test_bit_serial_inputs(self):
+        """Bit-serial planes shift-add back to the analog result."""
+        from device_layer.sram_fallback import SRAMFallbackModel
+        from architecture.neuratile import NeuraTile
+        tile = NeuraTile(tile_id=0, size=32, device_model=SRAMFallbackModel())
+        tile.program_weights(np.random.rand(32, 32))
+        crossbar = tile.crossbar
+        crossbar.input_mode = "bit_serial"
+        crossbar.dac_bits = 4
+
+        inputs = np.random.rand(6, 32)
+        planes = crossbar.bit_planes(inputs)
+        assert planes.shape == (6, 4, 32)
+        codes = (planes * (1 << np.arange(4))[:, None]).sum(axis=1)
+        np.testing.assert_array_equal(codes, np.round(inputs * 15))
+
+        quantized_inputs = codes / 15
+        expected = crossbar._column_currents(quantized_inputs) * 0.95
+        outputs = crossbar.read_outputs_batch(inputs)
+        np.testing.assert_allclose(outputs, expected, rtol=0.03)
+
+        tile.execute_layer_batch(inputs)
+        assert tile.power_monitor.read_cycles == int(np.count_nonzero(planes.sum(axis=2)))
+        assert tile.power_monitor.adc_energy == tile.power_monitor.read_cycles * 32 * 4.0
+
+    def test_weight_slicing(self):
+        """16-bit weights sliced over 4-bit cells recombine after the ADC."""
+        from architecture.weight_slicing import WeightSlicer
+        from device_layer.sram_fallback import SRAMFallbackModel
+        slicer = WeightSlicer(weight_bits=16, bits_per_cell=4)
+        weights = np.random.rand(32, 8)
+
+        sliced = slicer.slice_weights(weights)
+        assert sliced.shape == (32, 32)
+        np.testing.assert_allclose(slicer.combine(sliced, 8), np.round(weights * 65535) / 65535)
+
+        crossbar = CrossbarArray(size=32, device_model=SRAMFallbackModel(), weight_slicer=slicer, cols=8)
+        assert crossbar.physical_columns == 32
+        crossbar.program_weights(weights)
+        inputs = np.random.rand(4, 32)
+        outputs = crossbar.read_outputs_batch(inputs)
+        assert outputs.shape == (4, 8)
+        expected = inputs @ (weights / weights.max()) * crossbar.device_model.max_conductance * 0.95
+        np.testing.assert_allclose(outputs, expected, rtol=0.05)
+
+    def test_differential_signed_weights(self):
+        """Accuracy check: G+/G- pairs reproduce signed random matrices."""
+        from device_layer.sram_fallback import SRAMFallbackModel
+        crossbar = CrossbarArray(size=64, device_model=SRAMFallbackModel(), differential=True)
+        weights = np.random.randn(64, 64)
+        crossbar.program_weights(weights)
+        assert crossbar.conductances.shape == (64, 128)
+
+        inputs = np.random.rand(20, 64)
+        outputs = crossbar.read_outputs_batch(inputs)
+        g_max = crossbar.device_model.max_conductance
+        expected = inputs @ (weights / np.abs(weights).max()) * g_max * 0.95
+        # Residual error is dominated by 8-bit quantization of each plane's ADC
+        error = np.abs(outputs - expected).max() / np.abs(expected).max()
+        assert error < 0.06
+        assert np.corrcoef(outputs.ravel(), expected.ravel())[0, 1] > 0.999
+
+    def test_stuck_at_fault_maps(self):
+        """Fault masks pin cells through program and drift; patterns are structured."""
+        from device_layer.noise_models import StuckAtFaultMap
+        device = ReRAMModel()
+        rng = np.random.default_rng(0)
+        fault_map = StuckAtFaultMap((32, 32), 0.1, device.min_conductance, device.max_conductance, rng=rng)
+        assert 0.05 < fault_map.get_fault_fraction() < 0.15
+
+        crossbar = CrossbarArray(size=32, device_model=device)
+        crossbar.set_fault_map(fault_map)
+        crossbar.program_weights(np.random.rand(32, 32))
+        crossbar.update_drift(1e8)
+        g = crossbar.conductances
+        assert np.all(g[fault_map.stuck_at_max] == device.max_conductance)
+        assert np.all(g[fault_map.stuck_at_min] == device.min_conductance)
+
+        rows = StuckAtFaultMap((1000, 16, 16), 0.2, 0, 1, pattern="row", rng=rng).faulty
+        assert np.all(rows.all(axis=2) == rows.any(axis=2))
+        columns = StuckAtFaultMap((16, 16), 0.2, 0, 1, pattern="column", rng=rng).faulty
+        assert np.all(columns.all(axis=0) == columns.any(axis=0))
+        clustered = StuckAtFaultMap((64, 64), 0.05, 0, 1, pattern="clustered", rng=rng)
+        assert clustered.faulty.any()
+
+    def test_noise_pipeline(self):
+        """Stacked array noise stages drive reads; RTN keeps per-cell Markov states."""
+        from device_layer.device_config import DeviceConfig, DeviceFactory
+        from device_layer.noise_models import RandomTelegraphNoise
+        rng = np.random.default_rng(0)
+        rtn = RandomTelegraphNoise(amplitude=0.1, frequency=0.2, rng=rng)
+        g = np.full((500, 8, 8), 2.0)
+        noisy = rtn.apply(g)
+        assert rtn.states.shape == (8, 8)
+        assert np.all(np.isin(noisy, [1.8, 2.2]))
+        flip_rate = np.mean(noisy[1:] != noisy[:-1])
+        assert 0.15 < flip_rate < 0.25
+        assert np.all(noisy[-1] == 2.0 * (1 + 0.1 * rtn.states))
+
+        config = DeviceConfig(read_noise="pipeline", noise_level=0.05, rtn_amplitude=0.05,
+                              rtn_flip_probability=0.1)
+        pipeline = DeviceFactory.create_noise_pipeline(config)
+        assert len(pipeline) == 2
+        assert DeviceFactory.create_noise_pipeline(DeviceConfig()) is None
+
+        crossbar = CrossbarArray(size=16, device_model=ReRAMModel(), rng=rng)
+        crossbar.noise_pipeline = pipeline
+        weights = 0.5 + 0.5 * rng.random((16, 16))
+        crossbar.program_weights(weights)
+        inputs = np.ones((20, 16))
+        outputs = crossbar.read_outputs_batch(inputs)
+        assert outputs.shape == (20, 16)
+        assert np.std(outputs, axis=0).mean() > 0
+        expected = crossbar.device_model.read_columns(crossbar.conductances, inputs[0]) * 0.95
+        assert np.abs(outputs.mean(axis=0) / expected - 1).max() < 0.1
+
+    def test_endurance_wear(self):
+        """Writes are counted per cell and worn cells lose conductance window."""
+        from architecture.weight_slicing import WeightSlicer
+        from device_layer.drift_models import EnduranceDegradation
+        device = ReRAMModel()
+        crossbar = CrossbarArray(size=16, device_model=device, weight_slicer=WeightSlicer(16, 8),
+                                 differential=True, cols=8)
+        weights = np.random.randn(16, 8)
+        crossbar.program_weights(weights)
+        crossbar.program_region(np.ones((4, 2)), row_start=2, col_start=3)
+        counts = crossbar.write_counts
+        assert counts.shape == (16, 32)
+        assert counts.max() == 2 and counts.sum() == 16 * 32 + 4 * 2 * 2 * 2
+        assert np.all(counts[2:6, 6:10] == 2) and np.all(counts[2:6, 22:26] == 2)
+        np.testing.assert_allclose(crossbar.weights[2:6, 3:5], 1,
+                                   atol=crossbar.weight_scale / crossbar.weight_slicer.max_code)
+
+        crossbar = CrossbarArray(size=16, device_model=device)
+        crossbar.endurance_model = EnduranceDegradation(endurance_cycles=10, window_shrink=0.5)
+        crossbar.write_counts[:8] = 10
+        crossbar.program_weights(np.ones((16, 16)))
+        low, high = crossbar.endurance_model.conductance_window(
+            crossbar.write_counts, device.min_conductance, device.max_conductance
+        )
+        assert np.all(crossbar.conductances <= high)
+        assert crossbar.conductances[:8].max() < 0.8 * device.max_conductance
+        assert crossbar.get_wear()[:8].min() > 1.0
+
+    def test_regional_drift(self):
+        """Cells outside a reprogrammed block keep drifting from their own write."""
+        from device_layer.pcm_model import PCMModel
+        device = PCMModel()
+        ten_years = 10 * 365 * 24 * 3600 * 1e3
+        crossbar = CrossbarArray(size=32, device_model=device, rng=np.random.default_rng(0))
+        crossbar.program_weights(np.random.rand(32, 32))
+        original = crossbar.programmed_conductances
+        crossbar.update_drift(ten_years)
+        drifted = crossbar.conductances
+        crossbar.program_region(np.random.rand(1, 1), 0, 0)
+        outside = np.ones((32, 32), dtype=bool)
+        outside[0, 0] = False
+        np.testing.assert_array_equal(crossbar.programmed_conductances[outside], original[outside])
+        np.testing.assert_array_equal(crossbar.conductances[outside], drifted[outside])
+        written = crossbar.programmed_conductances[0, 0]
+        assert crossbar.conductances[0, 0] == written
+
+        crossbar.update_drift(ten_years)
+        np.testing.assert_allclose(crossbar.conductances[outside],
+                                   device.drift_array(original, 2 * ten_years)[outside])
+        np.testing.assert_allclose(crossbar.conductances[0, 0], device.drift_array(written, ten_years))
+        crossbar.program_weights(np.random.rand(32, 32))
+        assert crossbar.drift_epochs is None and len(crossbar.epoch_ages) == 1
+
+    def test_write_verify(self):
+        """Program-and-verify converges cells to tolerance with pulses only on pending cells."""
+        device = ReRAMModel()
+        weights = 0.2 + 0.8 * np.random.rand(32, 32)
+
+        single = CrossbarArray(size=32, device_model=device, rng=np.random.default_rng(1))
+        single.program_weights(weights)
+        assert single.program_stats["pulses"] == 32 * 32
+
+        crossbar = CrossbarArray(size=32, device_model=device, rng=np.random.default_rng(1))
+        crossbar.program_mode = "write_verify"
+        crossbar.verify_tolerance = 0.005
+        crossbar.max_pulses = 50
+        crossbar.program_weights(weights)
+        stats = crossbar.program_stats
+        targets = weights / weights.max() * device.max_conductance
+        error = np.abs(crossbar.conductances - targets)
+        assert stats["unconverged"] == 0
+        assert error.max() <= 0.005 * device.max_conductance
+        assert error.max() < np.abs(single.conductances - targets).max()
+        assert stats["pulses"] == crossbar.write_counts.sum() > 32 * 32
+        assert stats["verify_reads"] == stats["pulses"]
+        assert 1 < stats["iterations"] <= 50
+
+        # Fixed device-to-device error is measured and pre-compensated: every
+        # cell the chip can reach converges, without a pulse blow-up
+        from device_layer.variation_maps import DeviceVariationMap
+        variation = DeviceVariationMap.generate((32, 32), 0.1, 0.01, device.max_conductance,
+                                                np.random.default_rng(2))
+        chip = CrossbarArray(size=32, device_model=device, rng=np.random.default_rng(1))
+        chip.program_mode = "write_verify"
+        chip.verify_tolerance = 0.005
+        chip.max_pulses = 50
+        chip.variation_map = variation
+        chip.program_weights(weights)
+        tolerance = 0.005 * device.max_conductance
+        ceiling = variation.gain * device.max_conductance + variation.offset
+        reachable = targets < ceiling - 2 * tolerance
+        assert np.abs(chip.conductances - targets)[reachable].max() <= tolerance
+        assert chip.program_stats["unconverged"] <= np.count_nonzero(~reachable)
+        unreachable = np.count_nonzero(~reachable)
+        assert chip.program_stats["pulses"] < 2 * stats["pulses"] + 50 * unreachable
+
+    def test_mlc_levels(self):
+        """MLC mode stores uint8 level codes; reads, drift and faults go through the level table."""
+        from device_layer.mlc_levels import MLCLevels
+        from device_layer.noise_models import StuckAtFaultMap
+        from device_layer.pcm_model import PCMModel
+        device = PCMModel()
+        mlc = MLCLevels(8, device.min_conductance, device.max_conductance)
+        crossbar = CrossbarArray(size=32, device_model=device)
+        crossbar.set_mlc_levels(mlc)
+        weights = np.random.rand(32, 32)
+        crossbar.program_weights(weights)
+
+        # 1 B level code + 8 B logical weight + 4 B write count per cell
+        # (a dense float64 crossbar holds 20 B/cell, 28 B/cell once drifted)
+        assert crossbar.level_codes.dtype == np.uint8
+        assert crossbar.state_nbytes == 32 * 32 * (1 + 8 + 4) + crossbar.level_table.nbytes
+        from architecture.precision import PrecisionPolicy
+        compact = CrossbarArray(size=32, device_model=device, precision=PrecisionPolicy("float16", "float32"))
+        compact.set_mlc_levels(mlc)
+        compact.program_weights(weights)
+        assert compact.state_nbytes == 32 * 32 * (1 + 2 + 4) + compact.level_table.nbytes
+        assert np.all(np.isin(crossbar.conductances, mlc.levels))
+        targets = weights / weights.max() * device.max_conductance
+        spacing = mlc.levels[1] - mlc.levels[0]
+        assert np.abs(crossbar.conductances - np.maximum(targets, device.min_conductance)).max() <= spacing / 2
+
+        before = crossbar.conductances
+        crossbar.update_drift(1e7)
+        assert crossbar.conductances.max() < before.max()
+        np.testing.assert_allclose(crossbar.conductances, device.drift_array(before, 1e7))
+        assert crossbar.read_outputs(np.ones(32)).max() > 0
+
+        fault_map = StuckAtFaultMap((32, 32), 0.1, device.min_conductance, device.max_conductance,
+                                    rng=np.random.default_rng(0))
+        crossbar.set_fault_map(fault_map)
+        crossbar.program_weights(weights)
+        crossbar.update_drift(1e7)
+        assert np.all(crossbar.conductances[fault_map.stuck_at_max] == device.max_conductance)
+
+        # A region written after drift starts its own epoch; the rest of
+        # the array keeps drifting from the original write
+        regional = CrossbarArray(size=32, device_model=device)
+        regional.set_mlc_levels(mlc)
+        regional.program_weights(weights)
+        undrifted = regional.conductances
+        regional.update_drift(1e7)
+        drifted = regional.conductances
+        regional.program_region(weights[:8, :8], 0, 0)
+        outside = np.ones((32, 32), dtype=bool)
+        outside[:8, :8] = False
+        np.testing.assert_array_equal(regional.conductances[outside], drifted[outside])
+        np.testing.assert_array_equal(regional.conductances[:8, :8], undrifted[:8, :8])
+        regional.update_drift(1e7)
+        np.testing.assert_allclose(regional.conductances[outside],
+                                   device.drift_array(undrifted, 2e7)[outside])
+        np.testing.assert_allclose(regional.conductances[:8, :8],
+                                   device.drift_array(undrifted, 1e7)[:8, :8])
+        regional.program_weights(weights)
+        assert regional.drift_epochs is None and len(regional.level_table) == 1
+
+        spread = CrossbarArray(size=32, device_model=device)
+        spread.set_mlc_levels(MLCLevels(4, device.min_conductance, device.max_conductance,
+                                        level_sigma=[0.0, 0.05, 0.05, 0.1]))
+        spread.program_weights(weights)
+        reads = spread.read_outputs_batch(np.ones((50, 32)))
+        assert reads.std(axis=0).mean() > 0
+
+    def test_rectangular_crossbar(self):
+        """rows x cols crossbars read, slice and pair columns like square ones."""
+        from architecture.weight_slicing import WeightSlicer
+        crossbar = CrossbarArray(size=96, device_model=ReRAMModel(), cols=10)
+        assert crossbar.conductances.shape == (96, 10)
+        weights = 0.5 + 0.5 * np.random.rand(96, 10)
+        crossbar.program_weights(weights)
+        outputs = crossbar.read_outputs_batch(np.random.rand(5, 96))
+        assert outputs.shape == (5, 10)
+
+        paired = CrossbarArray(size=40, device_model=ReRAMModel(), cols=6,
+                               weight_slicer=WeightSlicer(16, 8), differential=True)
+        assert paired.output_size == 6 and paired.physical_columns == 24
+        paired.program_weights(np.random.randn(40, 6))
+        paired.program_region(np.zeros((2, 2)), row_start=0, col_start=4)
+        assert paired.read_outputs(np.ones(40)).shape == (6,)
+
+    def test_precision_policy(self):
+        """float16 storage shrinks crossbar state to 10 of 28 B/cell; reads accumulate in float32."""
+        from architecture.precision import PrecisionPolicy
+        from memory.global_sram import GlobalSRAM
+        weights = np.random.rand(32, 32)
+        inputs = np.random.rand(8, 32)
+        crossbars = {}
+        for storage, compute in [("float64", "float64"), ("float16", "float32")]:
+            crossbar = CrossbarArray(size=32, device_model=ReRAMModel(), rng=np.random.default_rng(0),
+                                     precision=PrecisionPolicy(storage, compute))
+            crossbar.program_weights(weights)
+            crossbar.update_drift(1000.0)
+            crossbars[storage] = (crossbar, crossbar.read_outputs_batch(inputs))
+
+        full, full_out = crossbars["float64"]
+        half, half_out = crossbars["float16"]
+        # Drifted conductance + programmed copy, logical weights, uint32 write counts
+        assert full.state_nbytes == 32 * 32 * (8 + 8 + 8 + 4)
+        assert half.state_nbytes == 32 * 32 * (2 + 2 + 2 + 4)
+        for crossbar in (full, half):
+            cell_arrays = {id(a): a for a in vars(crossbar).values()
+                           if isinstance(a, np.ndarray) and a.size >= 32 * 32}
+            assert crossbar.state_nbytes == sum(a.nbytes for a in cell_arrays.values())
+        assert half_out.dtype == np.float32
+        np.testing.assert_allclose(half.conductances, full.conductances, rtol=1e-3)
+        assert np.abs(half_out - full_out).max() < 0.02 * np.abs(full_out).max()
+
+        # Targets come from float64 weights: 16-bit slices and weights past
+        # the float16 range are unaffected by narrow storage
+        from architecture.weight_slicing import WeightSlicer
+        slicer = WeightSlicer(16, 8)
+        codes = np.arange(0, 65536, 128).reshape(32, 16)
+        wide = np.random.rand(32, 16) * 1e6
+        for matrix in (codes, wide):
+            sliced = {}
+            for storage, compute in [("float64", "float64"), ("float16", "float32")]:
+                crossbar = CrossbarArray(size=32, device_model=ReRAMModel(), cols=16,
+                                         weight_slicer=slicer,
+                                         precision=PrecisionPolicy(storage, compute))
+                crossbar.program_weights(matrix)
+                sliced[storage] = crossbar._targets()
+            assert np.all(np.isfinite(sliced["float16"]))
+            np.testing.assert_array_equal(sliced["float16"], sliced["float64"])
+
+        sram = GlobalSRAM(size_kB=1, precision=PrecisionPolicy("float16", "float32"))
+        sram.write(0, np.array([0.5, 1.5]))
+        assert sram.read(0, 4).dtype == np.float16
+        with pytest.raises(ValueError):
+            PrecisionPolicy("float32", "float16")
+
+    def test_read_cache(self):
+        """A held input is read through the crossbar once per conductance version."""
+        crossbar = CrossbarArray(size=32, device_model=ReRAMModel(), rng=np.random.default_rng(0))
+        crossbar.program_weights(np.random.rand(32, 32))
+        held = np.broadcast_to(np.random.rand(32), (20, 32))
+        noisy = crossbar.read_outputs_batch(held)
+        assert crossbar.read_cache_stats == {"hits": 19, "misses": 1}
+        assert np.ptp(noisy, axis=0).max() > 0
+
+        uncached = CrossbarArray(size=32, device_model=ReRAMModel(), rng=np.random.default_rng(0))
+        uncached.read_cache_size = 0
+        uncached.program_weights(crossbar.weights)
+        np.testing.assert_allclose(uncached.read_outputs_batch(held), noisy)
+
+        crossbar.update_drift(1000.0)
+        crossbar.read_outputs(held[0])
+        assert crossbar.read_cache_stats["misses"] == 2
+
+        # Batches without repeated rows skip the cache entirely
+        crossbar.read_outputs_batch(np.random.rand(20, 32))
+        assert crossbar.read_cache_stats == {"hits": 19, "misses": 2}
+
+        # Noise-free reads of a held input are identical at every step
+        device = ReRAMModel()
+        device.noise_std = 0.0
+        quiet = CrossbarArray(size=32, device_model=device)
+        quiet.program_weights(np.random.rand(32, 32))
+        outputs = quiet.read_outputs_batch(held)
+        assert np.ptp(outputs, axis=0).max() == 0
+
+        # Nodal reads are cached per wire resistance
+        quiet.ir_drop_model = "nodal"
+        before = quiet.read_outputs(held[0])
+        quiet.ir_solver.wire_resistance *= 100
+        assert not np.allclose(quiet.read_outputs(held[0]), before)
+
+
+class TestTileManager:
+    """Test tile manager."""
+
+    def test_lazy_tiles(self):
+        """Tiles are built only when first programmed or executed."""
+        manager = TileManager(num_tiles=16, tile_size=32, device_model=ReRAMModel())
+        assert manager.get_resident_count() == 0
+        manager.program_tile(3, np.random.rand(32, 32))
+        manager.execute(5, np.ones(32))
+        assert manager.get_resident_count() == 2
+
+        summary = manager.get_power_summary()
+        assert len(summary["per_tile"]) == 16
+        assert summary["per_tile"][0] == 0.0
+        assert summary["resident_tiles"] == 2
+        with pytest.raises(ValueError):
+            manager.program_tile(16, np.zeros((32, 32)))
+
+    def test_wear_aware_mapping(self):
+        """Partial loads count writes; hot layers go to the least-worn tiles."""
+        from memory.weight_loader import WeightLoader
+        manager = TileManager(num_tiles=3, tile_size=16, device_model=ReRAMModel())
+        loader = WeightLoader(num_tiles=3, tile_size=16, tile_manager=manager)
+        for _ in range(3):
+            loader.load_weights(0, np.random.rand(16, 16))
+        loader.partial_program(2, np.random.rand(4, 4), 0, 0)
+        assert list(manager.get_tile_wear()) == [3, 0, 1]
+        assert manager.get_tile(2).crossbar.write_counts.sum() == 16
+        mapping = manager.assign_layers_by_wear({"fc1": 0.1, "fc2": 10.0, "fc3": 1.0})
+        assert mapping == {"fc2": 1, "fc3": 2, "fc1": 0}
+
+    def test_rectangular_tiles(self):
+        """Tiles take per-layer shapes and charge only their physical columns."""
+        from memory.weight_loader import WeightLoader
+        manager = TileManager(num_tiles=2, tile_size=(784, 128), device_model=ReRAMModel(),
+                              differential=True)
+        manager.set_tile_shape(1, 128, 10)
+        loader = WeightLoader(num_tiles=2, tile_size=64, tile_manager=manager)
+        assert loader.load_weights(0, np.random.randn(784, 128))
+        assert loader.load_weights(1, np.random.randn(128, 10))
+        assert not loader.load_weights(1, np.random.randn(128, 128))
+
+        inputs = (np.random.rand(128) > 0.5).astype(float)
+        spikes = manager.execute(1, inputs)
+        tile = manager.get_tile(1)
+        assert tile.neurons.size == 10 and tile.crossbar.conductances.shape == (128, 20)
+        assert spikes.max(initial=0) < 10
+        active = int(np.count_nonzero(inputs))
+        assert tile.power_monitor.adc_energy == 20 * 4.0
+        assert tile.power_monitor.crossbar_energy == pytest.approx(active * 20 * 0.15)
+        with pytest.raises(ValueError):
+            manager.set_tile_shape(1, 64, 64)
+
+    def test_lazy_drift(self):
+        """Idle tiles drift only when touched, by the full elapsed time."""
+        from device_layer.pcm_model import PCMModel
+        manager = TileManager(num_tiles=2, tile_size=16, device_model=PCMModel())
+        manager.program_tile(0, np.random.rand(16, 16))
+        tile = manager.tiles[0]
+        programmed = tile.crossbar.conductances.copy()
+
+        manager.advance_time(3.6e6)
+        manager.advance_time(3.6e6)
+        # Not touched yet: no drift applied
+        np.testing.assert_array_equal(tile.crossbar.conductances, programmed)
+
+        manager.execute(0, np.zeros(16))
+        expected = tile.crossbar.device_model.drift_array(programmed, 7.2e6)
+        np.testing.assert_allclose(tile.crossbar.conductances, expected)
+        assert tile.last_update_time == 7.2e6
+        # Executing one step advances simulation time by dt
+        assert manager.sim_time == 7.2e6 + 1.0
+
+    def test_execution_advances_time(self):
+        """Every execution path advances simulation time by dt per step, once."""
+        from architecture.execution_engine import ExecutionEngine
+        from hybrid_compute.snn_mode import SNNMode
+        from simulation.multi_tile_sim import MultiTileSimulator
+
+        manager = TileManager(num_tiles=2, tile_size=16, device_model=ReRAMModel())
+        manager.execute(0, np.zeros(16))
+        manager.execute_batch(0, np.zeros((4, 16)))
+        assert manager.sim_time == 5.0
+
+        manager = TileManager(num_tiles=2, tile_size=16, device_model=ReRAMModel())
+        ExecutionEngine(manager, 2).execute_layer(0, np.zeros(16), timesteps=10)
+        assert manager.sim_time == 10.0
+        SNNMode(manager).forward(np.zeros(16), timesteps=7)
+        assert manager.sim_time == 17.0
+
+        manager = TileManager(num_tiles=2, tile_size=16, device_model=ReRAMModel())
+        sim = MultiTileSimulator(manager, 2)
+        for _ in range(3):
+            sim.execute_timestep({0: np.zeros(16), 1: np.zeros(16)})
+        assert manager.sim_time == 3.0
+
+        # update_device_state goes through sync_to: no double-counted drift
+        from device_layer.pcm_model import PCMModel
+        manager = TileManager(num_tiles=1, tile_size=16, device_model=PCMModel())
+        manager.program_tile(0, np.random.rand(16, 16))
+        tile = manager.tiles[0]
+        programmed = tile.crossbar.conductances.copy()
+        tile.update_device_state(3.6e6)
+        manager.advance_time(3.6e6)
+        manager.get_tile(0)
+        expected = tile.crossbar.device_model.drift_array(programmed, 3.6e6)
+        np.testing.assert_allclose(tile.crossbar.conductances, expected)
+
+    def test_fault_maps_from_config(self):
+        """DeviceConfig fault settings give each tile a fixed, seeded fault map."""
+        from device_layer.device_config import DeviceConfig
+        config = DeviceConfig(enable_stuck_at_faults=True, fault_rate=0.05)
+        masks = []
+        for _ in range(2):
+            manager = TileManager(2, 32, ReRAMModel(), seed=3, device_config=config)
+            masks.append([manager.get_tile(i).crossbar.fault_map.faulty for i in range(2)])
+        np.testing.assert_array_equal(masks[0][0], masks[1][0])
+        assert not np.array_equal(masks[0][0], masks[0][1])
+
+    def test_reproducible_tile_streams(self):
+        """Per-tile streams give bit-identical results in any execution order."""
+        from concurrent.futures import ThreadPoolExecutor
+
+        weights = np.random.rand(32, 32)
+        inputs = np.random.rand(20, 32)
+
+        def run(order, parallel=False):
+            manager = TileManager(num_tiles=4, tile_size=32, device_model=ReRAMModel(), seed=7)
+
+            def job(tile_id):
+                manager.program_tile(tile_id, weights)
+                return tile_id, manager.get_tile(tile_id).crossbar.read_outputs_batch(inputs)
+
+            if parallel:
+                with ThreadPoolExecutor(max_workers=4) as pool:
+                    return dict(pool.map(job, order))
+            return dict(job(t) for t in order)
+
+        serial = run([0, 1, 2, 3])
+        for other in (run([3, 1, 0, 2]), run([0, 1, 2, 3], parallel=True)):
+            for tile_id in range(4):
+                np.testing.assert_array_equal(serial[tile_id], other[tile_id])
+        assert not np.array_equal(serial[0], serial[1])
+
+        # Scalar-only models share one instance across tiles; their array
+        # fallbacks must not leak per-cell state or generators between threads
+        import sys
+        from device_layer.base_device import DeviceModel
+
+        class ScalarNoisy(DeviceModel):
+            max_conductance, min_conductance = 1e-4, 1e-6
+
+            def __init__(self):
+                super().__init__("scalar")
+                self.current_conductance = 5e-5
+
+            def program(self, conductance):
+                noisy = conductance * (1 + 0.05 * self._rng().standard_normal())
+                self.current_conductance = float(np.clip(noisy, self.min_conductance,
+                                                         self.max_conductance))
+                return self.current_conductance
+
+            def read(self, voltage):
+                return self.current_conductance * voltage
+
+            def update_drift(self, time_elapsed):
+                pass
+
+            def inject_noise(self):
+                return 1e-7 * self._rng().standard_normal()
+
+        def run_scalar(parallel):
+            manager = TileManager(num_tiles=4, tile_size=32, device_model=ScalarNoisy(), seed=7)
+
+            def job(tile_id):
+                manager.program_tile(tile_id, weights)
+                return tile_id, manager.get_tile(tile_id).crossbar.read_outputs_batch(inputs[:2])
+
+            if parallel:
+                with ThreadPoolExecutor(max_workers=4) as pool:
+                    return dict(pool.map(job, range(4)))
+            return dict(job(t) for t in range(4))
+
+        interval = sys.getswitchinterval()
+        sys.setswitchinterval(1e-5)
+        try:
+            serial, threaded = run_scalar(False), run_scalar(True)
+        finally:
+            sys.setswitchinterval(interval)
+        for tile_id in range(4):
+            np.testing.assert_array_equal(serial[tile_id], threaded[tile_id])
+
+    def test_write_verify_report(self):
+        """Tiles report programming pulses, latency and write energy."""
+        from device_layer.device_config import DeviceConfig
+        config = DeviceConfig(write_verify=True, verify_tolerance=0.01)
+        manager = TileManager(num_tiles=2, tile_size=16, device_model=ReRAMModel(), seed=3,
+                              device_config=config)
+        manager.program_tile(1, np.random.rand(16, 16))
+        report = manager.get_programming_summary()
+        monitor = manager.get_tile(1).power_monitor
+        assert report["pulses"][0] == 0 and report["pulses"][1] >= 16 * 16
+        assert report["latency_ns"][1] >= 16 * 120.0
+        assert report["write_energy"][1] > report["pulses"][1] * 5.0
+        assert monitor.get_total_energy() == monitor.write_energy
+
+    def test_chip_variation_maps(self, tmp_path):
+        """Device-to-device maps are fixed per chip seed, cached and persisted."""
+        from device_layer import variation_maps
+        from device_layer.device_config import DeviceConfig
+        config = DeviceConfig(d2d_gain_sigma=0.1, d2d_offset_sigma=0.01,
+                              variation_cache_dir=str(tmp_path))
+
+        def chip(seed):
+            manager = TileManager(num_tiles=2, tile_size=16, device_model=ReRAMModel(), seed=seed,
+                                  device_config=config)
+            return manager.get_tile(1).crossbar.variation_map
+
+        first = chip(5)
+        assert chip(5) is first
+        assert len(list(tmp_path.glob("d2d_*.npz"))) == 1
+        variation_maps._MAP_CACHE.clear()
+        reloaded = chip(5)
+        np.testing.assert_array_equal(reloaded.gain, first.gain)
+        assert not np.array_equal(chip(6).gain, first.gain)
+
+        # Maps no tile holds any more are released, not kept per seed forever
+        import gc
+        for seed in range(10, 20):
+            chip(seed)
+        gc.collect()
+        assert set(variation_maps._MAP_CACHE.values()) == {reloaded}
+
+        # The same cells err the same way on every reprogramming
+        device = ReRAMModel()
+        device.noise_std = 0.0
+        crossbar = CrossbarArray(size=16, device_model=device)
+        crossbar.variation_map = first
+        weights = 0.2 + 0.6 * np.random.rand(16, 16)
+        crossbar.program_weights(weights)
+        programmed = crossbar.programmed_conductances
+        crossbar.program_weights(weights)
+        np.testing.assert_array_equal(crossbar.programmed_conductances, programmed)
+        targets = weights / weights.max() * device.max_conductance
+        expected = np.clip(first.gain * targets + first.offset,
+                           device.min_conductance, device.max_conductance)
+        np.testing.assert_allclose(programmed, expected, rtol=1e-6)
+
+    def test_shipped_configs(self):
+        """Every config in configs/ programs a full tile-size layer and runs."""
+        import glob
+        import os
+        from api.config_parser import ConfigParser
+        from api.neuraedge_api import NeuraEdge
+        config_dir = os.path.join(os.path.dirname(__file__), os.pardir, "configs")
+        paths = sorted(glob.glob(os.path.join(config_dir, "*.yaml")))
+        assert paths
+        for path in paths:
+            config = ConfigParser.load(path)
+            assert ConfigParser.validate(config), path
+            platform = NeuraEdge(config)
+            size = config["tile_size"]
+            tile = platform.tile_manager.get_tile(0)
+            assert tile.crossbar.output_size == size, path
+            weights = np.random.rand(size, size)
+            assert platform.program_weights(0, weights), path
+            platform.run_inference(0, np.random.rand(size), timesteps=5)
+            assert platform.get_power_report()["total_energy_mj"] > 0, path
+        with pytest.raises(ValueError, match=rf"\({size}, {size}\)"):
+            tile.crossbar.program_weights(np.zeros((size, size // 2)))
+
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
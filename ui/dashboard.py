@@ -29,8 +29,13 @@ class Dashboard:
     def _get_tile_stats(self) -> list:
         """Get statistics per tile."""
         stats = []
+        tile_manager = self.api.tile_manager
         for tile_id in range(self.api.config["num_tiles"]):
-            tile = self.api.tile_manager.get_tile(tile_id)
+            # Skip building tiles that were never used
+            if not tile_manager.is_resident(tile_id):
+                stats.append({"tile_id": tile_id, "energy": 0.0, "spike_count": 0})
+                continue
+            tile = tile_manager.get_tile(tile_id)
             stats.append({
                 "tile_id": tile_id,
                 "energy": tile.power_monitor.get_total_energy(),
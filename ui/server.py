@@ -386,10 +386,10 @@ class NeuraEdgeHandler(BaseHTTPRequestHandler):
 
     def run_inference(self):
         """Execute inference and return results."""
-        np.random.seed(int(np.random.rand() * 1000))
-        weights = np.random.randn(64, 64) * 0.3
+        rng = np.random.default_rng()
+        weights = rng.standard_normal((64, 64)) * 0.3
         weights = (weights - weights.min()) / (weights.max() - weights.min() + 1e-8)
-        inputs = np.random.rand(64) * 1.5
+        inputs = rng.random(64) * 1.5
         inputs = (inputs > 0.5).astype(float)
 
         ne.program_weights(0, weights)
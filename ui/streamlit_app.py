@@ -11,6 +11,7 @@ import streamlit as st
 import numpy as np
 from api.neuraedge_api import NeuraEdge
 from ui.dashboard import Dashboard
+from device_layer.random_streams import make_generator
 
 # Page configuration
 st.set_page_config(
@@ -127,12 +128,12 @@ with tab2:
         if st.button("Run Inference", key="run_button"):
             with st.spinner("Running inference..."):
                 # Create input
-                np.random.seed(42 + st.session_state.run_count)
-                inputs = np.random.rand(tile_size)
+                rng = make_generator(42, st.session_state.run_count)
+                inputs = rng.random(tile_size)
                 inputs = (inputs > sparsity).astype(float)
 
                 # Create weights
-                weights = np.random.randn(tile_size, tile_size) * 0.3
+                weights = rng.standard_normal((tile_size, tile_size)) * 0.3
                 weights = (weights - weights.min()) / (weights.max() - weights.min() + 1e-8)
 
                 # Program and run